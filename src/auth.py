@@ -1,38 +1,125 @@
 """Authentication utilities for JWT and password hashing."""
 
 import os
+import hmac
+import asyncio
+import time
+import base64
+import hashlib
 import logging
+import threading
 from typing import Optional
-from datetime import datetime
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from concurrent.futures import ThreadPoolExecutor
+import bcrypt
+import orjson
+from cachetools import TTLCache
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
-from dotenv import load_dotenv
 
-from src.database import get_db
+from src.config import settings
+from src.database import get_read_db
 from src.models import User
 
-# Load environment variables
-load_dotenv()
-
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing cost factor
+# Cost factor 10 (2^10 rounds) keeps a verify around 50-100ms on typical
+# hosts. Existing hashes at other costs still verify.
+BCRYPT_ROUNDS = 10
+
+# Dedicated pool for bcrypt work, so a burst of logins cannot occupy the
+# threadpool that serves every other sync endpoint
+_hash_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt"
+)
+
+# Recent verification results, keyed by an HMAC of (hash, password) under
+# a per-process random key so the cache holds nothing usable offline
+_VERIFY_CACHE_KEY = os.urandom(32)
+_verify_cache = TTLCache(maxsize=1024, ttl=60)
+_verify_cache_lock = threading.Lock()
+
+# Successful logins and the token issued for them, keyed the same way by
+# (email, password); a client logging in again within the TTL skips both
+# the user lookup and bcrypt. Failures are never cached.
+LOGIN_CACHE_TTL_SECONDS = 30
+_login_cache = TTLCache(maxsize=10000, ttl=LOGIN_CACHE_TTL_SECONDS)
+_login_cache_lock = threading.Lock()
+
+# Password hashes of existing users by email, so repeated login attempts
+# skip the user query. Unknown emails are never cached, so new accounts
+# are seen at once; clear_login_cache() drops every entry.
+LOGIN_USER_CACHE_TTL_SECONDS = 300
+_login_user_cache = TTLCache(maxsize=10000, ttl=LOGIN_USER_CACHE_TTL_SECONDS)
 
 # JWT configuration
-JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
-if not JWT_SECRET_KEY:
-    raise ValueError("JWT_SECRET_KEY must be set in .env file")
+JWT_SECRET_KEY = settings().jwt_secret_key
 
 ALGORITHM = "HS256"
 
+# Precomputed HS256 signing material: the header never changes and the
+# secret is encoded once instead of on every token.
+_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+_KEY_BYTES = JWT_SECRET_KEY.encode('utf-8')
+
+# Upper bound on accepted token length; issued tokens are well under 1 KB
+MAX_TOKEN_LENGTH = 4096
+
 # HTTP Bearer for JWT authentication
 security = HTTPBearer()
 
+# Validated token cache (token digest -> (user id, exp claim or None)).
+# Lets repeat requests skip the JWT decode and the email lookup.
+TOKEN_CACHE_TTL_SECONDS = 300
+_token_cache = TTLCache(maxsize=4096, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
+# User lookup by email, built once so SQLAlchemy reuses its compiled form
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+
+def constant_eq(a: str, b: str) -> bool:
+    """
+    Compare two secret strings in constant time.
+
+    Use this instead of ``==`` whenever a token, signature or other secret is
+    compared in Python, so the comparison time does not leak how many leading
+    characters matched.
+
+    Args:
+        a: First value
+        b: Second value
+
+    Returns:
+        bool: True if the values are equal, False otherwise
+    """
+    return hmac.compare_digest(a.encode('utf-8'), b.encode('utf-8'))
+
+
+def _password_bytes(password: str) -> bytes:
+    """
+    Encode a password for bcrypt, truncated to bcrypt's 72-byte limit.
+
+    Passwords within the limit are encoded once and passed through. Longer
+    ones are cut at 72 bytes with any partial trailing UTF-8 character
+    dropped, which is the form existing hashes were created from.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        bytes: UTF-8 password bytes, at most 72 long
+    """
+    password_bytes = password.encode('utf-8')
+    if len(password_bytes) <= 72:
+        return password_bytes
+    return password_bytes[:72].decode('utf-8', errors='ignore').encode('utf-8')
+
 
 def hash_password(password: str) -> str:
     """
@@ -48,10 +135,8 @@ def hash_password(password: str) -> str:
         str: Hashed password
     """
     logger.debug("Hashing password")
-    # Bcrypt has a 72-byte limit, truncate if necessary
-    password_bytes = password.encode('utf-8')[:72]
-    password_truncated = password_bytes.decode('utf-8', errors='ignore')
-    return pwd_context.hash(password_truncated)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(_password_bytes(password), salt).decode('utf-8')
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -59,7 +144,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Verify a password against its hash.
 
     Bcrypt has a maximum password length of 72 bytes. Passwords longer than
-    this are truncated to match the hashing behavior.
+    this are truncated to match the hashing behavior. Results are cached for
+    60 seconds so repeated checks of the same pair skip bcrypt.
 
     Args:
         plain_password: Plain text password
@@ -69,16 +155,102 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: True if password matches, False otherwise
     """
     logger.debug("Verifying password")
-    # Bcrypt has a 72-byte limit, truncate if necessary
-    password_bytes = plain_password.encode('utf-8')[:72]
-    password_truncated = password_bytes.decode('utf-8', errors='ignore')
-    return pwd_context.verify(password_truncated, hashed_password)
+    password_bytes = _password_bytes(plain_password)
+    hash_bytes = hashed_password.encode('utf-8')
+
+    cache_key = hmac.new(_VERIFY_CACHE_KEY, hash_bytes + b"\0" + password_bytes, hashlib.sha256).digest()
+    with _verify_cache_lock:
+        cached = _verify_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("Password verification served from cache")
+        return cached
+
+    result = bcrypt.checkpw(password_bytes, hash_bytes)
+    with _verify_cache_lock:
+        _verify_cache[cache_key] = result
+    return result
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encode bytes without padding, as required by JWT."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the dedicated bcrypt pool.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        str: Hashed password
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the dedicated bcrypt pool.
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password to verify against
+
+    Returns:
+        bool: True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, verify_password, plain_password, hashed_password)
+
+
+def benchmark_password_hashing() -> float:
+    """
+    Time a single bcrypt verification at the configured cost factor.
+
+    Called once at startup so the log shows whether BCRYPT_ROUNDS suits the
+    host; aim for roughly 50-250ms per verify.
+
+    Returns:
+        float: Verification time in milliseconds
+    """
+    sample_hash = bcrypt.hashpw(b"benchmark", bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    start = time.perf_counter()
+    bcrypt.checkpw(b"benchmark", sample_hash)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    logger.info("bcrypt verify at %d rounds took %.1fms", BCRYPT_ROUNDS, elapsed_ms)
+    if elapsed_ms < 50 or elapsed_ms > 250:
+        logger.warning("bcrypt verify time %.1fms is outside 50-250ms, consider re-tuning BCRYPT_ROUNDS", elapsed_ms)
+    return elapsed_ms
+
+
+def warm_up_auth() -> None:
+    """
+    Exercise the password and token code paths once at startup.
+
+    Starts a bcrypt worker thread and runs a token round-trip so the first
+    login and the first authenticated request do not pay one-time setup costs.
+    """
+    start = time.perf_counter()
+    _hash_executor.submit(hash_password, "warmup").result()
+    hash_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    decode_token(create_access_token({"sub": "0"}))
+    token_ms = (time.perf_counter() - start) * 1000
+
+    logger.info("Auth warmup: bcrypt hash %.1fms, token round-trip %.2fms", hash_ms, token_ms)
 
 
 def create_access_token(data: dict) -> str:
     """
     Create a JWT access token that never expires.
 
+    The token is signed directly with HMAC-SHA256 using the precomputed
+    header and key, producing the same HS256 token a JWT library would.
+
     Args:
         data: Dictionary containing claims to encode in the token
 
@@ -87,42 +259,241 @@ def create_access_token(data: dict) -> str:
     """
     to_encode = data.copy()
     # Add issued at timestamp
-    to_encode.update({"iat": datetime.utcnow()})
+    to_encode.update({"iat": int(time.time())})
+
+    logger.info("Creating access token for user: %s", data.get('sub'))
+    payload = orjson.dumps(to_encode, default=str)
+    signing_input = _HEADER_B64 + b"." + _b64url_encode(payload)
+    signature = hmac.new(_KEY_BYTES, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url_encode(signature)).decode('ascii')
+
+
+def _has_valid_token_shape(token: str) -> bool:
+    """
+    Cheap structural check run before full token verification.
+
+    Rejects oversized tokens, tokens without exactly three segments and
+    tokens whose header names an algorithm other than ALGORITHM (e.g. an
+    RS256/HS256 confusion attempt).
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        bool: True if the token is worth verifying
+    """
+    if len(token) > MAX_TOKEN_LENGTH:
+        return False
+
+    parts = token.split(".")
+    if len(parts) != 3:
+        return False
+
+    header_b64 = parts[0]
+    try:
+        header = orjson.loads(base64.urlsafe_b64decode(header_b64 + "=" * (-len(header_b64) % 4)))
+    except ValueError:
+        return False
+    return isinstance(header, dict) and header.get("alg") == ALGORITHM
+
+
+def _verify_hs256(token: str) -> Optional[dict]:
+    """
+    Verify an HS256 token signed with JWT_SECRET_KEY.
+
+    Specialized for the single key and algorithm this service issues: one
+    HMAC-SHA256, a constant-time signature comparison and a payload parse,
+    followed by the same exp/nbf checks a JWT library applies. The token
+    must already have passed _has_valid_token_shape().
 
-    logger.info(f"Creating access token for user: {data.get('sub')}")
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    Args:
+        token: JWT token string
+
+    Returns:
+        Optional[dict]: Decoded token payload or None if invalid
+    """
+    header_b64, payload_b64, signature_b64 = token.split(".")
+
+    signing_input = f"{header_b64}.{payload_b64}".encode('utf-8')
+    expected = _b64url_encode(hmac.new(_KEY_BYTES, signing_input, hashlib.sha256).digest())
+    if not constant_eq(signature_b64, expected.decode('ascii')):
+        logger.warning("Token decode error: Signature verification failed")
+        return None
+
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(payload_b64 + "=" * (-len(payload_b64) % 4)))
+    except ValueError as e:
+        logger.warning("Token decode error: Invalid payload: %s", e)
+        return None
+    if not isinstance(payload, dict):
+        logger.warning("Token decode error: Payload is not a JSON object")
+        return None
+
+    now = time.time()
+    for claim in ("exp", "nbf", "iat"):
+        if claim in payload and not isinstance(payload[claim], (int, float)):
+            logger.warning("Token decode error: %s claim must be a number", claim)
+            return None
+    if "exp" in payload and now >= payload["exp"]:
+        logger.warning("Token decode error: Signature has expired")
+        return None
+    if "nbf" in payload and now < payload["nbf"]:
+        logger.warning("Token decode error: The token is not yet valid (nbf)")
+        return None
+
+    logger.debug("Token decoded successfully")
+    return payload
 
 
 def decode_token(token: str) -> Optional[dict]:
     """
     Decode and verify a JWT token.
 
+    HS256 tokens go through the specialized _verify_hs256(); the JWT
+    library is only used if ALGORITHM is changed.
+
     Args:
         token: JWT token string
 
     Returns:
         Optional[dict]: Decoded token payload or None if invalid
     """
+    if not _has_valid_token_shape(token):
+        logger.warning("Token rejected: malformed or unexpected algorithm")
+        return None
+
+    if ALGORITHM == "HS256":
+        return _verify_hs256(token)
+
     try:
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[ALGORITHM])
         logger.debug("Token decoded successfully")
         return payload
-    except JWTError as e:
-        logger.warning(f"Token decode error: {e}")
+    except jwt.InvalidTokenError as e:
+        logger.warning("Token decode error: %s", e)
         return None
 
 
+def _token_cache_key(token: str) -> str:
+    """
+    Build the cache key for a token.
+
+    The raw token is never stored; a short BLAKE2b digest is used instead.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        str: Hex digest identifying the token
+    """
+    return hashlib.blake2b(token.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def invalidate_token(token: str) -> None:
+    """
+    Remove a token from the validated token cache.
+
+    Args:
+        token: JWT token string
+    """
+    with _token_cache_lock:
+        _token_cache.pop(_token_cache_key(token), None)
+
+
+def _login_cache_key(email: str, password: str) -> bytes:
+    """Return the login cache key for an email/password pair."""
+    return hmac.new(
+        _VERIFY_CACHE_KEY,
+        email.encode('utf-8') + b"\0" + password.encode('utf-8'),
+        hashlib.sha256
+    ).digest()
+
+
+def get_cached_login(email: str, password: str) -> Optional[str]:
+    """
+    Return the token issued for a recent successful login, if any.
+
+    Args:
+        email: Login email
+        password: Plain text password
+
+    Returns:
+        Optional[str]: Cached access token, or None on a miss
+    """
+    with _login_cache_lock:
+        return _login_cache.get(_login_cache_key(email, password))
+
+
+def cache_login(email: str, password: str, token: str) -> None:
+    """
+    Remember a successful login for LOGIN_CACHE_TTL_SECONDS.
+
+    Args:
+        email: Login email
+        password: Plain text password that was verified
+        token: Access token issued for the login
+    """
+    with _login_cache_lock:
+        _login_cache[_login_cache_key(email, password)] = token
+
+
+def clear_login_cache() -> None:
+    """Forget all cached logins and password hashes, e.g. after a password change."""
+    with _login_cache_lock:
+        _login_cache.clear()
+        _login_user_cache.clear()
+
+
+def get_login_password_hash(db: Session, email: str) -> Optional[str]:
+    """
+    Return a user's password hash for login, cached by email.
+
+    Args:
+        db: Database session
+        email: Login email
+
+    Returns:
+        Optional[str]: The user's password hash, or None if no user has
+        this email
+    """
+    with _login_cache_lock:
+        password_hash = _login_user_cache.get(email)
+    if password_hash is not None:
+        return password_hash
+
+    user = get_user_by_email(db, email)
+    if user is None:
+        return None
+
+    with _login_cache_lock:
+        _login_user_cache[email] = user.password_hash
+    return user.password_hash
+
+
+def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    """
+    Look up a user by email using the prebuilt statement.
+
+    Args:
+        db: Database session
+        email: Email address to look up
+
+    Returns:
+        Optional[User]: The matching user or None
+    """
+    return db.execute(_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> User:
     """
     Dependency to get the current authenticated user from JWT token.
 
     Args:
         credentials: HTTP Authorization credentials containing JWT token
-        db: Database session
+        db: Read-only database session
 
     Returns:
         User: The authenticated user
@@ -137,6 +508,21 @@ def get_current_user(
     )
 
     token = credentials.credentials
+    cache_key = _token_cache_key(token)
+
+    # Fast path: token already validated recently
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+
+    if cached is not None:
+        user_id, expires_at = cached
+        if expires_at is None or expires_at > time.time():
+            user = db.get(User, user_id)
+            if user is not None:
+                logger.debug("User authenticated from token cache: %s", user.email)
+                return user
+        invalidate_token(token)
+
     payload = decode_token(token)
 
     if payload is None:
@@ -148,10 +534,13 @@ def get_current_user(
         logger.warning("Token missing subject claim")
         raise credentials_exception
 
-    user = db.query(User).filter(User.email == email).first()
+    user = get_user_by_email(db, email)
     if user is None:
-        logger.warning(f"User not found: {email}")
+        logger.warning("User not found: %s", email)
         raise credentials_exception
 
-    logger.info(f"User authenticated: {email}")
+    with _token_cache_lock:
+        _token_cache[cache_key] = (user.id, payload.get("exp"))
+
+    logger.debug("User authenticated: %s", email)
     return user
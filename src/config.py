@@ -0,0 +1,78 @@
+"""Application configuration loaded from the environment."""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, Optional
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Application settings read once from environment variables."""
+
+    name_app: str
+    path_blog: str
+    path_project_resources: str
+    path_database: str
+    name_db: str
+    jwt_secret_key: str
+    authorized_emails: FrozenSet[str]
+    downloads_accel_redirect: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def settings() -> Settings:
+    """
+    Load and validate application settings.
+
+    The .env file is parsed on the first call only; later calls return the
+    same Settings instance.
+
+    Returns:
+        Settings: Validated application settings
+
+    Raises:
+        ValueError: If a required environment variable is missing
+    """
+    load_dotenv()
+
+    path_blog = os.getenv("PATH_BLOG")
+    if not path_blog:
+        raise ValueError("PATH_BLOG must be set in .env file")
+
+    path_project_resources = os.getenv("PATH_PROJECT_RESOURCES")
+    if not path_project_resources:
+        raise ValueError("PATH_PROJECT_RESOURCES must be set in .env file")
+
+    path_database = os.getenv("PATH_DATABASE")
+    name_db = os.getenv("NAME_DB")
+    if not path_database or not name_db:
+        raise ValueError("PATH_DATABASE and NAME_DB must be set in .env file")
+
+    jwt_secret_key = os.getenv("JWT_SECRET_KEY")
+    if not jwt_secret_key:
+        raise ValueError("JWT_SECRET_KEY must be set in .env file")
+
+    # Emails allowed to register, compared case-insensitively
+    authorized_emails = frozenset(
+        email.strip().lower()
+        for email in os.getenv("EMAIL_ADMIN_LIST", "").split(",")
+        if email.strip()
+    )
+
+    # Internal nginx location that serves downloadable files, if any
+    downloads_accel_redirect = os.getenv("DOWNLOADS_ACCEL_REDIRECT") or None
+    if downloads_accel_redirect and not downloads_accel_redirect.endswith("/"):
+        downloads_accel_redirect += "/"
+
+    return Settings(
+        name_app=os.getenv("NAME_APP", "PersonalWeb03API"),
+        path_blog=path_blog,
+        path_project_resources=path_project_resources,
+        path_database=path_database,
+        name_db=name_db,
+        jwt_secret_key=jwt_secret_key,
+        authorized_emails=authorized_emails,
+        downloads_accel_redirect=downloads_accel_redirect
+    )
@@ -3,24 +3,22 @@
 import os
 import logging
 from pathlib import Path
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
-
+from contextvars import ContextVar
+from typing import List, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from src.config import settings
 from src.models import Base, User
 
-# Load environment variables
-load_dotenv()
-
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Get database configuration from environment
-PATH_DATABASE = os.getenv("PATH_DATABASE")
-NAME_DB = os.getenv("NAME_DB")
-
-if not PATH_DATABASE or not NAME_DB:
-    raise ValueError("PATH_DATABASE and NAME_DB must be set in .env file")
+# Get database configuration
+PATH_DATABASE = settings().path_database
+NAME_DB = settings().name_db
 
 # Ensure database directory exists
 db_dir = Path(PATH_DATABASE)
@@ -35,20 +33,77 @@ logger.info(f"Database URL: {DATABASE_URL}")
 # Create engine
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
+    connect_args={
+        "check_same_thread": False,  # Needed for SQLite
+        "timeout": 30.0  # Wait for locks instead of failing immediately
+    },
+    # Keep connections open across requests for the request threadpool;
+    # sized so a burst of requests does not queue on checkout
+    poolclass=QueuePool,
+    pool_size=20,
+    max_overflow=20
 )
 
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Apply SQLite performance settings to each new connection.
+
+    WAL lets readers run alongside a writer, and synchronous=NORMAL is safe
+    under WAL while avoiding an fsync on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-64000")  # 64 MB
+    cursor.close()
+
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Session factory for read-only lookups: AUTOCOMMIT skips the transaction
+# bookkeeping and the rollback when the connection returns to the pool
+ReadOnlySessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine.execution_options(isolation_level="AUTOCOMMIT")
+)
+
 
 def init_db():
     """Initialize the database by creating all tables."""
     logger.info("Initializing database tables...")
     Base.metadata.create_all(bind=engine)
+    create_missing_indexes()
     logger.info("Database tables created successfully")
 
 
+def create_missing_indexes():
+    """
+    Create model indexes that are missing from existing tables.
+
+    create_all() only builds indexes together with a new table, so indexes
+    added to the models later are created here. A unique index that cannot
+    be built because of duplicate rows is skipped with a warning.
+    """
+    with engine.begin() as conn:
+        # Empty directory names mean "no directory"; store them as NULL so
+        # they do not collide under the unique index
+        conn.exec_driver_sql("UPDATE blog_posts SET directory_name = NULL WHERE directory_name = ''")
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                with engine.begin() as conn:
+                    index.create(bind=conn, checkfirst=True)
+            except IntegrityError as e:
+                logger.warning("Could not create index %s, duplicate values exist: %s", index.name, e.orig)
+
+
 def seed_admin_user():
     """
     Create default admin user from environment variables on startup.
@@ -60,7 +115,7 @@ def seed_admin_user():
     Only creates if user doesn't already exist.
     """
     # Import here to avoid circular import
-    from src.auth import hash_password
+    from src.auth import hash_password, get_user_by_email
 
     logger.info("Checking admin user seed...")
 
@@ -86,7 +141,7 @@ def seed_admin_user():
     db = SessionLocal()
     try:
         # Check if user already exists
-        existing_user = db.query(User).filter(User.email == admin_email).first()
+        existing_user = get_user_by_email(db, admin_email)
 
         if existing_user:
             logger.info(f"Admin user already exists: {admin_email}")
@@ -112,14 +167,56 @@ def seed_admin_user():
         db.close()
 
 
-def get_db():
+# Sessions opened during the current request (at most one)
+_request_sessions: ContextVar[Optional[List[Session]]] = ContextVar("request_sessions", default=None)
+
+
+async def db_session_middleware(request, call_next):
     """
-    Dependency function to get database session.
+    Scope database sessions to the HTTP request.
 
-    Yields:
+    The session itself is only created when an endpoint asks for one, so
+    requests that never touch the database never open a session.
+    """
+    sessions: List[Session] = []
+    token = _request_sessions.set(sessions)
+    try:
+        return await call_next(request)
+    finally:
+        _request_sessions.reset(token)
+        for db in sessions:
+            db.close()
+
+
+def get_db() -> Session:
+    """
+    Dependency function to get the request's database session.
+
+    Returns:
         Session: SQLAlchemy database session
+
+    Raises:
+        RuntimeError: If db_session_middleware is not installed
     """
-    db = SessionLocal()
+    sessions = _request_sessions.get()
+    if sessions is None:
+        raise RuntimeError("get_db() called outside db_session_middleware")
+    if not sessions:
+        sessions.append(SessionLocal())
+    return sessions[0]
+
+
+def get_read_db():
+    """
+    Dependency function to get a read-only database session.
+
+    Use only for lookups; changes made through this session are not
+    wrapped in a transaction.
+
+    Yields:
+        Session: SQLAlchemy database session in AUTOCOMMIT mode
+    """
+    db = ReadOnlySessionLocal()
     try:
         yield db
     finally:
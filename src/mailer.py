@@ -0,0 +1,132 @@
+"""Outgoing email over a persistent SMTP connection."""
+
+import os
+import asyncio
+import logging
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Optional
+import aiosmtplib
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Email templates
+TEMPLATE_FOLDER = Path(__file__).parent / "templates" / "email"
+
+# Seconds to wait on the SMTP server before giving up
+SMTP_TIMEOUT_SECONDS = 30
+
+_templates = Environment(
+    loader=FileSystemLoader(TEMPLATE_FOLDER),
+    autoescape=select_autoescape(["html"])
+)
+
+# One SMTP session shared by every request; the lock serializes sends,
+# which SMTP requires on a single connection anyway
+_smtp: Optional[aiosmtplib.SMTP] = None
+_smtp_lock = asyncio.Lock()
+
+# Startup connect running in the background, so a slow or unreachable
+# server does not hold up application startup
+_connect_task: Optional[asyncio.Task] = None
+
+
+async def _open_connection() -> aiosmtplib.SMTP:
+    """
+    Connect and log in to the SMTP server configured in the environment.
+
+    Returns:
+        aiosmtplib.SMTP: Connected, authenticated SMTP client
+    """
+    smtp = aiosmtplib.SMTP(
+        hostname=os.getenv("MAIL_SERVER_MSOFFICE", "smtp.gmail.com"),
+        port=int(os.getenv("MAIL_PORT", "587")),
+        use_tls=os.getenv("MAIL_SSL", "False").lower() == "true",
+        start_tls=os.getenv("MAIL_TLS", "True").lower() == "true",
+        validate_certs=True,
+        timeout=SMTP_TIMEOUT_SECONDS
+    )
+    await smtp.connect()
+    await smtp.login(os.getenv("MAIL_FROM", ""), os.getenv("MAIL_PASSWORD", ""))
+    return smtp
+
+
+async def connect_mailer() -> None:
+    """
+    Open the shared SMTP connection on application startup.
+
+    A failure is only logged; the connection is retried on the first send.
+    """
+    global _smtp
+    async with _smtp_lock:
+        try:
+            _smtp = await _open_connection()
+            logger.info("SMTP connection established")
+        except (aiosmtplib.SMTPException, OSError) as e:
+            logger.warning("Could not connect to SMTP server, will retry on first send: %s", e)
+
+
+def start_mailer() -> None:
+    """
+    Start opening the shared SMTP connection without waiting for it.
+
+    Must be called from the running event loop, e.g. a startup handler.
+    """
+    global _connect_task
+    _connect_task = asyncio.create_task(connect_mailer())
+
+
+async def close_mailer() -> None:
+    """Close the shared SMTP connection on application shutdown."""
+    global _smtp, _connect_task
+    if _connect_task is not None:
+        # Still connecting at shutdown; give up on it
+        _connect_task.cancel()
+        try:
+            await _connect_task
+        except asyncio.CancelledError:
+            pass
+        _connect_task = None
+    async with _smtp_lock:
+        if _smtp is not None and _smtp.is_connected:
+            try:
+                await _smtp.quit()
+            except aiosmtplib.SMTPException:
+                _smtp.close()
+        _smtp = None
+
+
+async def send_template_email(subject: str, recipient: str, template_name: str, context: dict) -> None:
+    """
+    Render an HTML email template and send it over the shared connection.
+
+    Reconnects if the connection is missing or the server has dropped it.
+
+    Args:
+        subject: Email subject line
+        recipient: Recipient address
+        template_name: Template file name in the email templates folder
+        context: Variables passed to the template
+
+    Raises:
+        aiosmtplib.SMTPException: If the message cannot be sent
+    """
+    message = EmailMessage()
+    message["Subject"] = subject
+    message["From"] = os.getenv("MAIL_FROM", "")
+    message["To"] = recipient
+    message.set_content(_templates.get_template(template_name).render(**context), subtype="html")
+
+    global _smtp
+    async with _smtp_lock:
+        if _smtp is None or not _smtp.is_connected:
+            _smtp = await _open_connection()
+        try:
+            await _smtp.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            # Servers close idle sessions; reconnect once and retry
+            logger.info("SMTP connection was closed by the server, reconnecting")
+            _smtp = await _open_connection()
+            await _smtp.send_message(message)
@@ -1,41 +1,57 @@
 """Main FastAPI application for PersonalWeb03API."""
 
-import os
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+import anyio.to_thread
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
 
-from src.database import init_db, seed_admin_user
+from src.config import settings
+from src.database import init_db, seed_admin_user, db_session_middleware
+from src.auth import benchmark_password_hashing, warm_up_auth
+from src.mailer import start_mailer, close_mailer
+from src.static_files import CachedStaticFiles
 from src.routers import auth, blog, hero_section, downloads, admin
 
-# Load environment variables
-load_dotenv()
-
 # Configure logging
+# Request threads only enqueue records; a listener thread does the console
+# and file I/O.
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(log_formatter)
+
+file_handler = RotatingFileHandler(
+    'personalweb03_api.log',
+    maxBytes=10 * 1024 * 1024,  # 10 MB
+    backupCount=5,
+    delay=True
+)
+file_handler.setFormatter(log_formatter)
+
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('personalweb03_api.log')
-    ]
+    format='%(message)s',  # Full formatting is applied by the listener's handlers
+    handlers=[QueueHandler(log_queue)]
 )
+log_listener.start()
 
 logger = logging.getLogger(__name__)
 
-# Get configuration from environment
-PATH_BLOG = os.getenv("PATH_BLOG")
-PATH_PROJECT_RESOURCES = os.getenv("PATH_PROJECT_RESOURCES")
-NAME_APP = os.getenv("NAME_APP", "PersonalWeb03API")
+# Get configuration
+PATH_BLOG = settings().path_blog
+PATH_PROJECT_RESOURCES = settings().path_project_resources
+NAME_APP = settings().name_app
 
-if not PATH_BLOG:
-    raise ValueError("PATH_BLOG must be set in .env file")
-
-if not PATH_PROJECT_RESOURCES:
-    raise ValueError("PATH_PROJECT_RESOURCES must be set in .env file")
+# Worker threads for sync endpoints and run_in_threadpool. Database work is
+# already capped by the connection pool (40); the headroom keeps file and
+# bcrypt requests from queueing behind it.
+THREADPOOL_SIZE = 100
 
 # Create FastAPI application
 app = FastAPI(
@@ -53,6 +69,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# One lazily created database session per request
+app.middleware("http")(db_session_middleware)
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(blog.router)
@@ -76,11 +95,11 @@ downloadable_path.mkdir(parents=True, exist_ok=True)
 logger.info(f"Downloadable directory: {downloadable_path}")
 
 # Mount static files for serving blog posts
-app.mount("/posts", StaticFiles(directory=str(posts_path)), name="posts")
+app.mount("/posts", CachedStaticFiles(directory=str(posts_path), check_dir=False), name="posts")
 logger.info("Mounted static files at /posts")
 
 # Mount static files for serving blog icons
-app.mount("/blog/icons", StaticFiles(directory=str(icons_path)), name="blog-icons")
+app.mount("/blog/icons", CachedStaticFiles(directory=str(icons_path), check_dir=False), name="blog-icons")
 logger.info("Mounted static files at /blog/icons")
 
 
@@ -92,6 +111,29 @@ def startup_event():
     logger.info("Database initialized successfully")
     seed_admin_user()
     logger.info("Admin user seed completed")
+    benchmark_password_hashing()
+    warm_up_auth()
+
+
+@app.on_event("startup")
+async def startup_threadpool():
+    """Raise the worker thread limit used by sync endpoints."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    logger.info(f"Threadpool size: {THREADPOOL_SIZE}")
+
+
+@app.on_event("startup")
+async def startup_mailer():
+    """Open the shared SMTP connection in the background on application startup."""
+    start_mailer()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the SMTP connection and flush queued log records on shutdown."""
+    logger.info("Shutting down PersonalWeb03API")
+    await close_mailer()
+    log_listener.stop()
 
 
 @app.get("/")
@@ -1,10 +1,13 @@
 """Database models for PersonalWeb03API."""
 
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, DateTime, Date
-from sqlalchemy.ext.declarative import declarative_base
+from typing import Optional
+from sqlalchemy import String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base for all models."""
 
 
 class User(Base):
@@ -12,11 +15,11 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    email = Column(String, unique=True, nullable=False, index=True)
-    password_hash = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    email: Mapped[str] = mapped_column(String, unique=True, index=True)
+    password_hash: Mapped[str] = mapped_column(String)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 class BlogPost(Base):
@@ -24,12 +27,12 @@ class BlogPost(Base):
 
     __tablename__ = "blog_posts"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    title = Column(String, nullable=False)
-    description = Column(String, nullable=True)
-    post_item_image = Column(String, nullable=True)
-    directory_name = Column(String, nullable=True)
-    date_shown_on_blog = Column(Date, default=date.today, nullable=False)
-    link_to_external_post = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    title: Mapped[str] = mapped_column(String)
+    description: Mapped[Optional[str]] = mapped_column(String)
+    post_item_image: Mapped[Optional[str]] = mapped_column(String)
+    directory_name: Mapped[Optional[str]] = mapped_column(String, unique=True, index=True)
+    date_shown_on_blog: Mapped[date] = mapped_column(default=date.today)
+    link_to_external_post: Mapped[Optional[str]] = mapped_column(String)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -2,12 +2,21 @@
 
 import csv
 import io
+import time
+import shutil
 import logging
+import tarfile
+import tempfile
 import zipfile
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, date
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from typing import Iterator, List, Optional, TextIO, BinaryIO
+import zstandard
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import Table, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from src.database import get_db
@@ -19,6 +28,43 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
+# Fastest DEFLATE level; CSV text still compresses well at 1
+BACKUP_COMPRESSION_LEVEL = 1
+
+# Zstandard level for .tar.zst backups (3 is zstd's real-time default)
+ZSTD_COMPRESSION_LEVEL = 3
+
+# Restored rows are inserted in batches of this size to bound memory
+RESTORE_BATCH_SIZE = 1000
+
+# Staging files stay in memory up to this size before spilling to disk
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# Backup archives are sent to the client in chunks of this size
+BACKUP_CHUNK_SIZE = 1024 * 1024
+
+USER_CSV_HEADER = ['id', 'email', 'password_hash', 'created_at', 'updated_at']
+POST_CSV_HEADER = [
+    'id', 'title', 'description', 'post_item_image',
+    'directory_name', 'date_shown_on_blog', 'link_to_external_post',
+    'created_at', 'updated_at'
+]
+
+
+# Date formats grouped by separator, in priority order within each group
+HYPHEN_DATE_FORMATS = (
+    '%Y-%m-%d',      # ISO: 2025-12-04
+    '%m-%d-%Y',      # Hyphenated: 12-04-2025
+    '%m-%d-%y',      # Hyphenated: 12-04-25
+    '%d-%m-%Y',      # European: 04-12-2025
+)
+SLASH_DATE_FORMATS = (
+    '%m/%d/%y',      # US: 12/4/25
+    '%m/%d/%Y',      # US: 12/04/2025
+    '%Y/%m/%d',      # Alternative ISO: 2025/12/04
+    '%d/%m/%Y',      # European: 04/12/2025
+)
+
 
 def parse_flexible_date(date_string: str) -> Optional[date]:
     """
@@ -46,22 +92,13 @@ def parse_flexible_date(date_string: str) -> Optional[date]:
 
     date_string = date_string.strip()
 
-    # List of date formats to try
-    formats = [
-        '%Y-%m-%d',      # ISO: 2025-12-04
-        '%m/%d/%y',      # US: 12/4/25
-        '%m/%d/%Y',      # US: 12/04/2025
-        '%m-%d-%Y',      # Hyphenated: 12-04-2025
-        '%m-%d-%y',      # Hyphenated: 12-04-25
-        '%Y/%m/%d',      # Alternative ISO: 2025/12/04
-        '%d/%m/%Y',      # European: 04/12/2025
-        '%d-%m-%Y',      # European: 04-12-2025
-    ]
+    # Only formats using the string's separator can match
+    formats = SLASH_DATE_FORMATS if '/' in date_string else HYPHEN_DATE_FORMATS
 
     for fmt in formats:
         try:
             parsed_date = datetime.strptime(date_string, fmt).date()
-            logger.debug(f"Successfully parsed '{date_string}' using format '{fmt}' -> {parsed_date}")
+            logger.debug("Successfully parsed '%s' using format '%s' -> %s", date_string, fmt, parsed_date)
             return parsed_date
         except ValueError:
             continue
@@ -70,20 +107,243 @@ def parse_flexible_date(date_string: str) -> Optional[date]:
     raise ValueError(f"Could not parse date string '{date_string}' in any known format")
 
 
+def write_user_csv(db: Session, stream: TextIO) -> int:
+    """
+    Write every user as a CSV row, streaming from the database.
+
+    Args:
+        db: Database session
+        stream: Text stream to write CSV into
+
+    Returns:
+        int: Number of users written
+    """
+    user_writer = csv.writer(stream, lineterminator='\n')
+    user_writer.writerow(USER_CSV_HEADER)
+
+    user_count = db.query(func.count(User.id)).scalar()
+    user_rows = db.query(
+        User.id, User.email, User.password_hash, User.created_at, User.updated_at
+    ).yield_per(1000)
+    # writerows drives the loop in C; the generator only formats timestamps
+    user_writer.writerows(
+        (
+            user_id,
+            email,
+            password_hash,
+            created_at.isoformat() if created_at else '',
+            updated_at.isoformat() if updated_at else ''
+        )
+        for user_id, email, password_hash, created_at, updated_at in user_rows
+    )
+
+    logger.info(f"Backed up {user_count} users")
+    return user_count
+
+
+def write_post_csv(db: Session, stream: TextIO) -> int:
+    """
+    Write every blog post as a CSV row, streaming from the database.
+
+    Args:
+        db: Database session
+        stream: Text stream to write CSV into
+
+    Returns:
+        int: Number of blog posts written
+    """
+    post_writer = csv.writer(stream, lineterminator='\n')
+    post_writer.writerow(POST_CSV_HEADER)
+
+    post_count = db.query(func.count(BlogPost.id)).scalar()
+    post_rows = db.query(
+        BlogPost.id, BlogPost.title, BlogPost.description, BlogPost.post_item_image,
+        BlogPost.directory_name, BlogPost.date_shown_on_blog, BlogPost.link_to_external_post,
+        BlogPost.created_at, BlogPost.updated_at
+    ).yield_per(1000)
+    post_writer.writerows(
+        (
+            post_id,
+            title,
+            description or '',
+            post_item_image or '',
+            directory_name or '',
+            date_shown_on_blog.isoformat() if date_shown_on_blog else '',
+            link_to_external_post or '',
+            created_at.isoformat() if created_at else '',
+            updated_at.isoformat() if updated_at else ''
+        )
+        for (post_id, title, description, post_item_image, directory_name,
+             date_shown_on_blog, link_to_external_post, created_at, updated_at) in post_rows
+    )
+
+    logger.info(f"Backed up {post_count} blog posts")
+    return post_count
+
+
+BACKUP_TABLES = (
+    ('db_backup/user.csv', write_user_csv),
+    ('db_backup/blogpost.csv', write_post_csv),
+)
+
+
+def write_zip_backup(db: Session, output: BinaryIO, level: int) -> None:
+    """
+    Write the backup CSVs into a DEFLATE-compressed ZIP archive.
+
+    Args:
+        db: Database session
+        output: Binary stream receiving the archive
+        level: DEFLATE compression level, or 0 to store entries uncompressed
+    """
+    # Level 0 skips DEFLATE entirely for the fastest possible backup
+    compression = zipfile.ZIP_STORED if level == 0 else zipfile.ZIP_DEFLATED
+    with zipfile.ZipFile(output, 'w', compression, compresslevel=level or None) as zip_file:
+        for name, write_csv in BACKUP_TABLES:
+            # Stream rows straight into the archive entry
+            with zip_file.open(name, 'w', force_zip64=True) as raw:
+                text = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+                write_csv(db, text)
+                text.flush()
+                text.detach()
+
+
+def write_tar_zst_backup(db: Session, output: BinaryIO) -> None:
+    """
+    Write the backup CSVs into a zstd-compressed tar archive.
+
+    Tar headers need each member's size up front, so every CSV is staged
+    in a spooled temporary file before being added.
+
+    Args:
+        db: Database session
+        output: Binary stream receiving the archive
+    """
+    compressor = zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL, threads=-1)
+    with compressor.stream_writer(output, closefd=False) as compressed, \
+            tarfile.open(fileobj=compressed, mode='w|') as tar:
+        for name, write_csv in BACKUP_TABLES:
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as staging:
+                text = io.TextIOWrapper(staging, encoding='utf-8', newline='')
+                write_csv(db, text)
+                text.flush()
+                text.detach()
+
+                info = tarfile.TarInfo(name)
+                info.size = staging.tell()
+                info.mtime = int(time.time())
+                staging.seek(0)
+                tar.addfile(info, staging)
+
+
+def insert_ignoring_conflicts(db: Session, table: Table, rows: List[dict]) -> int:
+    """
+    Insert rows in one statement, letting the database skip duplicates.
+
+    Rows that violate a primary key or unique constraint are dropped by
+    ON CONFLICT DO NOTHING instead of failing the whole batch.
+
+    Args:
+        db: Database session
+        table: Table to insert into
+        rows: Column mappings to insert
+
+    Returns:
+        int: Number of rows skipped because of a conflict
+    """
+    if not rows:
+        return 0
+    result = db.execute(sqlite_insert(table).on_conflict_do_nothing(), rows)
+    return len(rows) - result.rowcount
+
+
+def build_backup(db: Session, archive_format: str, level: int) -> BinaryIO:
+    """
+    Build a backup archive in a spooled temporary file.
+
+    Args:
+        db: Database session
+        archive_format: "zip" or "tar.zst"
+        level: DEFLATE compression level, ZIP only
+
+    Returns:
+        BinaryIO: Temporary file holding the archive, rewound to the start
+    """
+    backup_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    try:
+        if archive_format == "tar.zst":
+            write_tar_zst_backup(db, backup_file)
+        else:
+            write_zip_backup(db, backup_file, level)
+    except Exception:
+        backup_file.close()
+        raise
+
+    backup_file.seek(0)
+    return backup_file
+
+
+def iter_file_chunks(fileobj: BinaryIO) -> Iterator[bytes]:
+    """
+    Yield a file's contents in BACKUP_CHUNK_SIZE chunks, closing it afterwards.
+
+    Args:
+        fileobj: Binary file to stream
+
+    Yields:
+        bytes: Next chunk of the file
+    """
+    try:
+        while True:
+            chunk = fileobj.read(BACKUP_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        fileobj.close()
+
+
+@contextmanager
+def open_tar_zst(fileobj: BinaryIO) -> Iterator[tarfile.TarFile]:
+    """
+    Open a zstd-compressed tar archive for random access.
+
+    The archive is decompressed once into a spooled temporary file so
+    members can be looked up by name.
+
+    Args:
+        fileobj: Binary stream containing the .tar.zst archive
+
+    Yields:
+        tarfile.TarFile: Opened tar archive
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+        with zstandard.ZstdDecompressor().stream_reader(fileobj, closefd=False) as reader:
+            shutil.copyfileobj(reader, spool)
+        spool.seek(0)
+        with tarfile.open(fileobj=spool, mode='r:') as tar:
+            yield tar
+
+
 @router.post("/database/backup")
-def backup_database(
+async def backup_database(
+    level: int = Query(BACKUP_COMPRESSION_LEVEL, ge=0, le=9),
+    archive_format: str = Query("zip", alias="format", pattern="^(zip|tar\\.zst)$"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    Generate a backup of all database tables as a ZIP file containing CSV files.
+    Generate a backup of all database tables as an archive of CSV files.
 
     Args:
+        level: DEFLATE compression level (1 fastest, 9 smallest, 0 stores
+            entries uncompressed), ZIP only
+        archive_format: Archive type, "zip" (default) or "tar.zst"
         current_user: Authenticated user
         db: Database session
 
     Returns:
-        StreamingResponse: ZIP file containing CSV files for each table
+        StreamingResponse: Archive containing CSV files for each table
 
     Raises:
         HTTPException: If backup generation fails
@@ -91,72 +351,23 @@ def backup_database(
     logger.info(f"Database backup initiated by user: {current_user.email}")
 
     try:
-        # Create in-memory ZIP file
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # Backup User table
-            users = db.query(User).all()
-            logger.info(f"Backing up {len(users)} users")
-
-            user_csv = io.StringIO()
-            user_writer = csv.writer(user_csv)
-            # Write header
-            user_writer.writerow(['id', 'email', 'password_hash', 'created_at', 'updated_at'])
-            # Write data
-            for user in users:
-                user_writer.writerow([
-                    user.id,
-                    user.email,
-                    user.password_hash,
-                    user.created_at.isoformat() if user.created_at else '',
-                    user.updated_at.isoformat() if user.updated_at else ''
-                ])
-
-            zip_file.writestr('db_backup/user.csv', user_csv.getvalue())
-            logger.debug("User table backed up successfully")
-
-            # Backup BlogPost table
-            posts = db.query(BlogPost).all()
-            logger.info(f"Backing up {len(posts)} blog posts")
-
-            post_csv = io.StringIO()
-            post_writer = csv.writer(post_csv)
-            # Write header
-            post_writer.writerow([
-                'id', 'title', 'description', 'post_item_image',
-                'directory_name', 'date_shown_on_blog', 'link_to_external_post',
-                'created_at', 'updated_at'
-            ])
-            # Write data
-            for post in posts:
-                post_writer.writerow([
-                    post.id,
-                    post.title,
-                    post.description or '',
-                    post.post_item_image or '',
-                    post.directory_name or '',
-                    post.date_shown_on_blog.isoformat() if post.date_shown_on_blog else '',
-                    post.link_to_external_post or '',
-                    post.created_at.isoformat() if post.created_at else '',
-                    post.updated_at.isoformat() if post.updated_at else ''
-                ])
-
-            zip_file.writestr('db_backup/blogpost.csv', post_csv.getvalue())
-            logger.debug("BlogPost table backed up successfully")
-
-        # Prepare ZIP for download
-        zip_buffer.seek(0)
-
         # Generate timestamp for filename
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"db_backup_personalweb03_{timestamp}.zip"
+        if archive_format == "tar.zst":
+            filename = f"db_backup_personalweb03_{timestamp}.tar.zst"
+            media_type = "application/zstd"
+        else:
+            filename = f"db_backup_personalweb03_{timestamp}.zip"
+            media_type = "application/zip"
+
+        # Query and compress off the event loop
+        backup_file = await run_in_threadpool(build_backup, db, archive_format, level)
 
         logger.info(f"Database backup completed successfully: {filename}")
 
         return StreamingResponse(
-            zip_buffer,
-            media_type="application/zip",
+            iter_file_chunks(backup_file),
+            media_type=media_type,
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
             }
@@ -170,6 +381,194 @@ def backup_database(
         )
 
 
+def restore_users(db: Session, csv_file: BinaryIO) -> dict:
+    """
+    Restore the User table from CSV text.
+
+    Rows are inserted into the caller's transaction; committing or rolling
+    back is left to the caller.
+
+    Args:
+        db: Database session
+        csv_file: Binary stream of user.csv, read incrementally
+
+    Returns:
+        dict: users_imported, users_skipped and skipped_details for this table
+    """
+    summary = {"users_imported": 0, "users_skipped": 0, "skipped_details": []}
+    user_reader = csv.reader(io.TextIOWrapper(csv_file, encoding='utf-8', newline=''))
+
+    # Resolve column positions once; columns missing from older backups
+    # point at an empty cell padded onto every row
+    header = next(user_reader, [])
+    columns = {name: i for i, name in enumerate(header)}
+    blank = len(header)
+    padding = [''] * (blank + 1)
+    id_i, email_i, hash_i = columns['id'], columns['email'], columns['password_hash']
+    created_i = columns.get('created_at', blank)
+    updated_i = columns.get('updated_at', blank)
+
+    # Load existing keys once instead of querying per row
+    existing_user_ids = {r[0] for r in db.query(User.id).all()}
+    existing_emails = {r[0] for r in db.query(User.email).all()}
+    # Every mapping carries the same keys so the INSERT runs as one batch
+    now = datetime.utcnow()
+    user_rows = []
+    user_conflicts = 0
+
+    for row in user_reader:
+        if not row:
+            continue
+        row.extend(padding[len(row):])
+        user_id = int(row[id_i])
+        email = row[email_i]
+
+        # Check if ID exists
+        if user_id in existing_user_ids:
+            logger.warning(f"Skipping user ID {user_id}: ID already exists")
+            summary["users_skipped"] += 1
+            summary["skipped_details"].append(f"User ID {user_id}: ID exists")
+            continue
+
+        # Check if email exists
+        if email in existing_emails:
+            logger.warning(f"Skipping user {email}: email already exists")
+            summary["users_skipped"] += 1
+            summary["skipped_details"].append(f"User {email}: email exists")
+            continue
+
+        # Import user, keeping timestamps if available
+        user_rows.append({
+            "id": user_id,
+            "email": email,
+            "password_hash": row[hash_i],
+            "created_at": datetime.fromisoformat(row[created_i]) if row[created_i] else now,
+            "updated_at": datetime.fromisoformat(row[updated_i]) if row[updated_i] else now
+        })
+        existing_user_ids.add(user_id)
+        existing_emails.add(email)
+        summary["users_imported"] += 1
+        logger.debug("Imported user: %s", email)
+
+        if len(user_rows) >= RESTORE_BATCH_SIZE:
+            user_conflicts += insert_ignoring_conflicts(db, User.__table__, user_rows)
+            user_rows.clear()
+
+    user_conflicts += insert_ignoring_conflicts(db, User.__table__, user_rows)
+
+    # Rows added by someone else since the keys were loaded
+    if user_conflicts:
+        logger.warning(f"Skipped {user_conflicts} users that conflicted on insert")
+        summary["users_imported"] -= user_conflicts
+        summary["users_skipped"] += user_conflicts
+        summary["skipped_details"].append(f"{user_conflicts} users: conflicted on insert")
+
+    logger.info(f"User table restore complete: {summary['users_imported']} imported, {summary['users_skipped']} skipped")
+    return summary
+
+
+def restore_posts(db: Session, csv_file: BinaryIO) -> dict:
+    """
+    Restore the BlogPost table from CSV text.
+
+    Rows are inserted into the caller's transaction; committing or rolling
+    back is left to the caller.
+
+    Args:
+        db: Database session
+        csv_file: Binary stream of blogpost.csv, read incrementally
+
+    Returns:
+        dict: posts_imported, posts_skipped and skipped_details for this table
+    """
+    summary = {"posts_imported": 0, "posts_skipped": 0, "skipped_details": []}
+    post_reader = csv.reader(io.TextIOWrapper(csv_file, encoding='utf-8', newline=''))
+
+    # Resolve column positions once, as for users
+    header = next(post_reader, [])
+    columns = {name: i for i, name in enumerate(header)}
+    blank = len(header)
+    padding = [''] * (blank + 1)
+    id_i, title_i, dir_i = columns['id'], columns['title'], columns['directory_name']
+    description_i, image_i = columns['description'], columns['post_item_image']
+    shown_i = columns.get('date_shown_on_blog', blank)
+    link_i = columns.get('link_to_external_post', blank)
+    created_i = columns.get('created_at', blank)
+    updated_i = columns.get('updated_at', blank)
+
+    # Load existing keys once instead of querying per row
+    existing_post_ids = {r[0] for r in db.query(BlogPost.id).all()}
+    # Link posts have no directory and never collide, so leave them out
+    existing_dirs = {
+        r[0] for r in db.query(BlogPost.directory_name).filter(BlogPost.directory_name.isnot(None))
+    }
+    now = datetime.utcnow()
+    today = date.today()
+    post_rows = []
+    post_conflicts = 0
+
+    for row in post_reader:
+        if not row:
+            continue
+        row.extend(padding[len(row):])
+        post_id = int(row[id_i])
+        directory_name = row[dir_i] if row[dir_i] else None
+
+        # Check if ID exists
+        if post_id in existing_post_ids:
+            logger.warning(f"Skipping blog post ID {post_id}: ID already exists")
+            summary["posts_skipped"] += 1
+            summary["skipped_details"].append(f"BlogPost ID {post_id}: ID exists")
+            continue
+
+        # Check if directory_name exists (only if not null)
+        if directory_name and directory_name in existing_dirs:
+            logger.warning(f"Skipping blog post {post_id}: directory {directory_name} exists")
+            summary["posts_skipped"] += 1
+            summary["skipped_details"].append(
+                f"BlogPost ID {post_id}: directory {directory_name} exists"
+            )
+            continue
+
+        # Use date_shown_on_blog if available, otherwise the default
+        shown_date = None
+        if row[shown_i]:
+            shown_date = parse_flexible_date(row[shown_i])
+
+        # Import blog post, keeping timestamps if available
+        post_rows.append({
+            "id": post_id,
+            "title": row[title_i],
+            "description": row[description_i] if row[description_i] else None,
+            "post_item_image": row[image_i] if row[image_i] else None,
+            "directory_name": directory_name,
+            "date_shown_on_blog": shown_date or today,
+            "link_to_external_post": row[link_i] if row[link_i] else None,
+            "created_at": datetime.fromisoformat(row[created_i]) if row[created_i] else now,
+            "updated_at": datetime.fromisoformat(row[updated_i]) if row[updated_i] else now
+        })
+        existing_post_ids.add(post_id)
+        if directory_name:
+            existing_dirs.add(directory_name)
+        summary["posts_imported"] += 1
+        logger.debug("Imported blog post: %s", row[title_i])
+
+        if len(post_rows) >= RESTORE_BATCH_SIZE:
+            post_conflicts += insert_ignoring_conflicts(db, BlogPost.__table__, post_rows)
+            post_rows.clear()
+
+    post_conflicts += insert_ignoring_conflicts(db, BlogPost.__table__, post_rows)
+
+    if post_conflicts:
+        logger.warning(f"Skipped {post_conflicts} blog posts that conflicted on insert")
+        summary["posts_imported"] -= post_conflicts
+        summary["posts_skipped"] += post_conflicts
+        summary["skipped_details"].append(f"{post_conflicts} blog posts: conflicted on insert")
+
+    logger.info(f"BlogPost table restore complete: {summary['posts_imported']} imported, {summary['posts_skipped']} skipped")
+    return summary
+
+
 @router.post("/database/restore")
 def restore_database(
     zip_file: UploadFile = File(...),
@@ -177,10 +576,14 @@ def restore_database(
     db: Session = Depends(get_db)
 ):
     """
-    Restore database from a backup ZIP file containing CSV files.
+    Restore database from a backup archive containing CSV files.
+
+    Accepts the ZIP archives produced by the backup endpoint as well as
+    .tar.zst archives. Both tables are restored in one transaction, so a
+    failure leaves the database unchanged.
 
     Args:
-        zip_file: ZIP file containing CSV backups
+        zip_file: ZIP or .tar.zst file containing CSV backups
         current_user: Authenticated user
         db: Database session
 
@@ -192,12 +595,13 @@ def restore_database(
     """
     logger.info(f"Database restore initiated by user: {current_user.email}")
 
-    # Validate ZIP file
-    if not zip_file.filename.endswith('.zip'):
+    # Validate archive type
+    is_tar_zst = zip_file.filename.endswith('.tar.zst')
+    if not zip_file.filename.endswith('.zip') and not is_tar_zst:
         logger.warning(f"Invalid file type uploaded: {zip_file.filename}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File must be a ZIP archive"
+            detail="File must be a ZIP or .tar.zst archive"
         )
 
     summary = {
@@ -209,147 +613,69 @@ def restore_database(
     }
 
     try:
-        # Read ZIP file
-        with zipfile.ZipFile(zip_file.file, 'r') as zip_ref:
-            # Check for required CSV files
-            zip_contents = zip_ref.namelist()
+        with ExitStack() as stack:
+            # Open the archive and list its files
+            if is_tar_zst:
+                tar = stack.enter_context(open_tar_zst(zip_file.file))
+                zip_contents = [member.name for member in tar.getmembers() if member.isfile()]
+                open_member = tar.extractfile
+            else:
+                zip_ref = stack.enter_context(zipfile.ZipFile(zip_file.file, 'r'))
+                zip_contents = zip_ref.namelist()
+                open_member = zip_ref.open
             logger.info(f"ZIP contents: {zip_contents}")
 
-            # Filter out __MACOSX and find CSV files in db_backup* folders
+            # Index CSV files once: root-level files, and files inside
+            # db_backup* / database_backup* folders by name, ignoring __MACOSX
+            root_files = set()
+            backup_files = {}
+            for path in zip_contents:
+                if '__MACOSX' in path:
+                    logger.debug("Skipping __MACOSX: %s", path)
+                    continue
+                if '/' not in path:
+                    root_files.add(path)
+                elif path.startswith(('db_backup', 'database_backup')):
+                    backup_files.setdefault(path.rsplit('/', 1)[1], path)
+
             def find_csv_file(csv_name):
-                """Find CSV file in db_backup* or database_backup* folder, ignoring __MACOSX."""
-                logger.debug(f"Looking for: {csv_name}")
-                candidates = []
-
-                for path in zip_contents:
-                    # Skip __MACOSX folders
-                    if '__MACOSX' in path:
-                        logger.debug(f"Skipping __MACOSX: {path}")
-                        continue
-
-                    # Look for csv files in folders starting with db_backup or database_backup
-                    if path.endswith(f'/{csv_name}'):
-                        if path.startswith('db_backup') or path.startswith('database_backup'):
-                            logger.debug(f"Found candidate: {path}")
-                            candidates.append(path)
-
-                    # Also check root level for backwards compatibility
-                    if path == csv_name:
-                        logger.debug(f"Found at root level: {path}")
-                        return path
-
-                if candidates:
-                    selected = candidates[0]
+                """Find CSV file at root level or in a db_backup* or database_backup* folder."""
+                # Root level wins for backwards compatibility
+                if csv_name in root_files:
+                    logger.debug("Found at root level: %s", csv_name)
+                    return csv_name
+
+                selected = backup_files.get(csv_name)
+                if selected:
                     logger.info(f"Selected CSV path: {selected}")
                     return selected
 
                 logger.warning(f"Could not find {csv_name} in ZIP. Searched for files ending with '/{csv_name}' in folders starting with 'db_backup' or 'database_backup'")
                 return None
 
-            # Find user.csv
+            # Restore users, then posts, in the request's transaction
+            table_summaries = []
             user_csv_path = find_csv_file('user.csv')
             if user_csv_path:
                 logger.info(f"Restoring User table from: {user_csv_path}")
-                user_csv_data = zip_ref.read(user_csv_path).decode('utf-8')
-                user_reader = csv.DictReader(io.StringIO(user_csv_data))
-
-                for row in user_reader:
-                    user_id = int(row['id'])
-                    email = row['email']
-
-                    # Check if ID exists
-                    existing_by_id = db.query(User).filter(User.id == user_id).first()
-                    if existing_by_id:
-                        logger.warning(f"Skipping user ID {user_id}: ID already exists")
-                        summary["users_skipped"] += 1
-                        summary["skipped_details"].append(f"User ID {user_id}: ID exists")
-                        continue
-
-                    # Check if email exists
-                    existing_by_email = db.query(User).filter(User.email == email).first()
-                    if existing_by_email:
-                        logger.warning(f"Skipping user {email}: email already exists")
-                        summary["users_skipped"] += 1
-                        summary["skipped_details"].append(f"User {email}: email exists")
-                        continue
-
-                    # Import user
-                    new_user = User(
-                        id=user_id,
-                        email=email,
-                        password_hash=row['password_hash']
-                    )
-                    # Set timestamps if available
-                    if row.get('created_at'):
-                        new_user.created_at = datetime.fromisoformat(row['created_at'])
-                    if row.get('updated_at'):
-                        new_user.updated_at = datetime.fromisoformat(row['updated_at'])
-
-                    db.add(new_user)
-                    summary["users_imported"] += 1
-                    logger.debug(f"Imported user: {email}")
-
-                db.commit()
-                logger.info(f"User table restore complete: {summary['users_imported']} imported, {summary['users_skipped']} skipped")
-
-            # Restore BlogPost table if exists
+                with open_member(user_csv_path) as csv_file:
+                    table_summaries.append(restore_users(db, csv_file))
+
             blogpost_csv_path = find_csv_file('blogpost.csv')
             if blogpost_csv_path:
                 logger.info(f"Restoring BlogPost table from: {blogpost_csv_path}")
-                post_csv_data = zip_ref.read(blogpost_csv_path).decode('utf-8')
-                post_reader = csv.DictReader(io.StringIO(post_csv_data))
-
-                for row in post_reader:
-                    post_id = int(row['id'])
-                    directory_name = row['directory_name'] if row['directory_name'] else None
-
-                    # Check if ID exists
-                    existing_by_id = db.query(BlogPost).filter(BlogPost.id == post_id).first()
-                    if existing_by_id:
-                        logger.warning(f"Skipping blog post ID {post_id}: ID already exists")
-                        summary["posts_skipped"] += 1
-                        summary["skipped_details"].append(f"BlogPost ID {post_id}: ID exists")
-                        continue
-
-                    # Check if directory_name exists (only if not null)
-                    if directory_name:
-                        existing_by_dir = db.query(BlogPost).filter(
-                            BlogPost.directory_name == directory_name
-                        ).first()
-                        if existing_by_dir:
-                            logger.warning(f"Skipping blog post {post_id}: directory {directory_name} exists")
-                            summary["posts_skipped"] += 1
-                            summary["skipped_details"].append(
-                                f"BlogPost ID {post_id}: directory {directory_name} exists"
-                            )
-                            continue
-
-                    # Import blog post
-                    new_post = BlogPost(
-                        id=post_id,
-                        title=row['title'],
-                        description=row['description'] if row['description'] else None,
-                        post_item_image=row['post_item_image'] if row['post_item_image'] else None,
-                        directory_name=directory_name,
-                        link_to_external_post=row.get('link_to_external_post') if row.get('link_to_external_post') else None
-                    )
-                    # Set date_shown_on_blog if available, otherwise use default
-                    if row.get('date_shown_on_blog'):
-                        parsed_date = parse_flexible_date(row['date_shown_on_blog'])
-                        if parsed_date:
-                            new_post.date_shown_on_blog = parsed_date
-                    # Set timestamps if available
-                    if row.get('created_at'):
-                        new_post.created_at = datetime.fromisoformat(row['created_at'])
-                    if row.get('updated_at'):
-                        new_post.updated_at = datetime.fromisoformat(row['updated_at'])
-
-                    db.add(new_post)
-                    summary["posts_imported"] += 1
-                    logger.debug(f"Imported blog post: {row['title']}")
-
-                db.commit()
-                logger.info(f"BlogPost table restore complete: {summary['posts_imported']} imported, {summary['posts_skipped']} skipped")
+                with open_member(blogpost_csv_path) as csv_file:
+                    table_summaries.append(restore_posts(db, csv_file))
+
+            # Commit only once every table has been restored
+            db.commit()
+
+            for table_summary in table_summaries:
+                for key, value in table_summary.items():
+                    if key == "skipped_details":
+                        summary["skipped_details"].extend(value)
+                    else:
+                        summary[key] += value
 
         logger.info(f"Database restore completed successfully: {summary}")
         return {
@@ -358,14 +684,22 @@ def restore_database(
         }
 
     except zipfile.BadZipFile:
+        db.rollback()
         logger.error("Invalid ZIP file uploaded")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid ZIP file"
         )
+    except (tarfile.TarError, zstandard.ZstdError):
+        db.rollback()
+        logger.error("Invalid .tar.zst file uploaded")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid .tar.zst file"
+        )
     except Exception as e:
-        logger.error(f"Database restore failed: {e}")
         db.rollback()
+        logger.error(f"Database restore failed: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Restore failed: {str(e)}"
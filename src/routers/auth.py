@@ -1,48 +1,120 @@
 """Authentication router for user registration and login."""
 
 import os
+import time
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from collections import deque
-from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
+from typing import List, Tuple
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, EmailStr
-from jose import jwt, JWTError
+import jwt
 
+from src.config import settings
 from src.database import get_db
 from src.models import User
-from src.schemas import UserRegister, UserLogin, Token
-from src.auth import hash_password, verify_password, create_access_token
+from src.schemas import UserRegister, UserLogin, Token, ForgotPasswordRequest, ResetPasswordRequest
+from src.mailer import send_template_email
+from src.auth import (
+    hash_password,
+    hash_password_async,
+    verify_password_async,
+    create_access_token,
+    get_user_by_email,
+    get_login_password_hash,
+    get_cached_login,
+    cache_login,
+    clear_login_cache,
+    invalidate_token,
+    security
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-# Rate limiting: Track reset email requests (email -> deque of timestamps)
-reset_email_requests = {}
-
-# Email configuration
-mail_config = ConnectionConfig(
-    MAIL_USERNAME=os.getenv("MAIL_FROM", ""),
-    MAIL_PASSWORD=os.getenv("MAIL_PASSWORD", ""),
-    MAIL_FROM=os.getenv("MAIL_FROM", ""),
-    MAIL_PORT=int(os.getenv("MAIL_PORT", "587")),
-    MAIL_SERVER=os.getenv("MAIL_SERVER_MSOFFICE", "smtp.gmail.com"),
-    MAIL_STARTTLS=os.getenv("MAIL_TLS", "True").lower() == "true",
-    MAIL_SSL_TLS=os.getenv("MAIL_SSL", "False").lower() == "true",
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=True,
-    TEMPLATE_FOLDER=Path(__file__).parent.parent / "templates" / "email"
-)
+# Password reset token signing
+JWT_SECRET = settings().jwt_secret_key
+RESET_TOKEN_ALGORITHM = "HS256"
+RESET_TOKEN_TTL = timedelta(minutes=30)
+
+# Reset email rate limit: at most RESET_RATE_LIMIT emails per address
+# across the last RESET_RATE_WINDOW_MINUTES one-minute buckets
+RESET_RATE_LIMIT = 3
+RESET_RATE_WINDOW_MINUTES = 5
+
+# Stale rate limit entries are swept every this many requests
+RESET_RATE_GC_INTERVAL = 500
+
+# Most addresses tracked at once; the least recently used is evicted first
+RESET_RATE_MAX_ENTRIES = 10000
+
+# Rate limiting: email -> (minute of the newest bucket, per-minute counts
+# oldest first), kept in least recently used order
+reset_email_requests: "OrderedDict[str, Tuple[int, List[int]]]" = OrderedDict()
+_reset_requests_since_gc = 0
+
+
+def _reset_request_counts(email: str, minute: int) -> List[int]:
+    """
+    Return an email's per-minute reset counts, shifted to end at `minute`.
+
+    Args:
+        email: Lowercased email address
+        minute: Current minute since the epoch
+
+    Returns:
+        List[int]: RESET_RATE_WINDOW_MINUTES counts, oldest first
+    """
+    entry = reset_email_requests.get(email)
+    if entry is None:
+        return [0] * RESET_RATE_WINDOW_MINUTES
 
-fastmail = FastMail(mail_config)
+    last_minute, counts = entry
+    elapsed = minute - last_minute
+    if elapsed >= RESET_RATE_WINDOW_MINUTES:
+        return [0] * RESET_RATE_WINDOW_MINUTES
+    if elapsed > 0:
+        return counts[elapsed:] + [0] * elapsed
+    return counts
+
+
+def _sweep_reset_requests(minute: int) -> None:
+    """
+    Drop rate limit entries that have no requests left in the window.
+
+    Runs every RESET_RATE_GC_INTERVAL calls so addresses that never return
+    do not accumulate.
+
+    Args:
+        minute: Current minute since the epoch
+    """
+    global _reset_requests_since_gc
+    _reset_requests_since_gc += 1
+    if _reset_requests_since_gc < RESET_RATE_GC_INTERVAL:
+        return
+    _reset_requests_since_gc = 0
+
+    cutoff = minute - RESET_RATE_WINDOW_MINUTES
+    stale = [email for email, (last_minute, _) in reset_email_requests.items() if last_minute <= cutoff]
+    for email in stale:
+        del reset_email_requests[email]
+    if stale:
+        logger.debug("Dropped %d stale reset rate limit entries", len(stale))
+
+
+def _save_new_user(db: Session, user: User) -> None:
+    """Insert a new user and refresh it with its generated fields."""
+    db.add(user)
+    db.commit()
+    db.refresh(user)
 
 
 @router.post("/register", status_code=status.HTTP_201_CREATED, response_model=Token)
-def register(user_data: UserRegister, db: Session = Depends(get_db)):
+async def register(user_data: UserRegister, db: Session = Depends(get_db)):
     """
     Register a new user and return access token.
 
@@ -59,8 +131,8 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
     logger.info(f"Registration attempt for email: {user_data.email}")
 
     # Check if email is in the authorized admin list
-    admin_list_str = os.getenv("EMAIL_ADMIN_LIST", "")
-    if not admin_list_str:
+    authorized_emails = settings().authorized_emails
+    if not authorized_emails:
         # If EMAIL_ADMIN_LIST is not set or empty, block all registrations
         logger.warning(f"Registration blocked: EMAIL_ADMIN_LIST not configured - {user_data.email}")
         raise HTTPException(
@@ -68,9 +140,6 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
             detail="Registration restricted to authorized email addresses"
         )
 
-    # Parse comma-separated email list and convert to lowercase
-    authorized_emails = [email.strip().lower() for email in admin_list_str.split(",")]
-
     # Check if the user's email (case-insensitive) is in the authorized list
     if user_data.email.lower() not in authorized_emails:
         logger.warning(f"Registration blocked: Unauthorized email - {user_data.email}")
@@ -80,7 +149,7 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
         )
 
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await run_in_threadpool(get_user_by_email, db, user_data.email)
     if existing_user:
         logger.warning(f"Registration failed: Email already exists - {user_data.email}")
         raise HTTPException(
@@ -89,15 +158,13 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
         )
 
     # Hash password and create user
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await hash_password_async(user_data.password)
     new_user = User(
         email=user_data.email,
         password_hash=hashed_password
     )
 
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await run_in_threadpool(_save_new_user, db, new_user)
 
     # Create access token for the newly registered user
     access_token = create_access_token(data={"sub": new_user.email})
@@ -107,7 +174,7 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     """
     Authenticate user and return JWT token.
 
@@ -123,9 +190,15 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
     """
     logger.info(f"Login attempt for email: {user_data.email}")
 
-    # Find user by email
-    user = db.query(User).filter(User.email == user_data.email).first()
-    if not user:
+    # Same credentials succeeded moments ago
+    cached_token = get_cached_login(user_data.email, user_data.password)
+    if cached_token:
+        logger.info(f"User logged in successfully (cached): {user_data.email}")
+        return {"access_token": cached_token, "token_type": "bearer"}
+
+    # Find user by email (the hash is cached after the first lookup)
+    password_hash = await run_in_threadpool(get_login_password_hash, db, user_data.email)
+    if password_hash is None:
         logger.warning(f"Login failed: User not found - {user_data.email}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -133,7 +206,7 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
         )
 
     # Verify password
-    if not verify_password(user_data.password, user.password_hash):
+    if not await verify_password_async(user_data.password, password_hash):
         logger.warning(f"Login failed: Invalid password - {user_data.email}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -141,31 +214,69 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
         )
 
     # Create access token
-    access_token = create_access_token(data={"sub": user.email})
+    access_token = create_access_token(data={"sub": user_data.email})
+    cache_login(user_data.email, user_data.password, access_token)
 
     logger.info(f"User logged in successfully: {user_data.email}")
     return {"access_token": access_token, "token_type": "bearer"}
 
 
-# Pydantic schemas for password reset
-class ForgotPasswordRequest(BaseModel):
-    """Schema for forgot password request."""
-    email: EmailStr
+@router.post("/logout")
+def logout(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """
+    Drop the caller's token from the validated token cache.
+
+    Tokens never expire, so this does not revoke the token itself; the next
+    request using it is validated from scratch.
+
+    Args:
+        credentials: HTTP Authorization credentials containing JWT token
+
+    Returns:
+        dict: Success message
+    """
+    invalidate_token(credentials.credentials)
+    logger.info("Token removed from validation cache")
+    return {"message": "Logged out successfully"}
+
+
+async def _send_reset_email(email: str, reset_link: str) -> None:
+    """
+    Send a password reset email, logging failures.
 
+    Runs as a background task after the response has been sent, so errors
+    can only be logged.
 
-class ResetPasswordRequest(BaseModel):
-    """Schema for reset password request."""
-    token: str
-    new_password: str
+    Args:
+        email: Recipient address
+        reset_link: Link to the reset page, including the token
+    """
+    try:
+        await send_template_email(
+            subject="Reset Your Password - PersonalWeb03",
+            recipient=email,
+            template_name="password_reset.html",
+            context={"reset_link": reset_link}
+        )
+        logger.info(f"Password reset email sent to: {email}")
+    except Exception as e:
+        logger.error(f"Failed to send password reset email to {email}: {e}")
 
 
 @router.post("/forgot-password")
-async def forgot_password(request: ForgotPasswordRequest, db: Session = Depends(get_db)):
+async def forgot_password(
+    request: ForgotPasswordRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """
     Send password reset email to user.
 
+    The email is sent in the background after the response is returned.
+
     Args:
         request: Forgot password request with email
+        background_tasks: Background task queue for the email send
         db: Database session
 
     Returns:
@@ -177,28 +288,19 @@ async def forgot_password(request: ForgotPasswordRequest, db: Session = Depends(
     logger.info(f"Password reset requested for: {request.email}")
 
     # Check rate limiting (max 3 emails per 5 minutes)
-    now = datetime.now()
+    minute = int(time.time() // 60)
     email_lower = request.email.lower()
+    _sweep_reset_requests(minute)
 
-    if email_lower in reset_email_requests:
-        # Remove timestamps older than 5 minutes
-        reset_email_requests[email_lower] = deque(
-            [ts for ts in reset_email_requests[email_lower] if now - ts < timedelta(minutes=5)],
-            maxlen=3
+    if sum(_reset_request_counts(email_lower, minute)) >= RESET_RATE_LIMIT:
+        logger.warning(f"Rate limit exceeded for: {request.email}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many reset requests. Please try again in 5 minutes."
         )
 
-        # Check if limit exceeded
-        if len(reset_email_requests[email_lower]) >= 3:
-            logger.warning(f"Rate limit exceeded for: {request.email}")
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Too many reset requests. Please try again in 5 minutes."
-            )
-    else:
-        reset_email_requests[email_lower] = deque(maxlen=3)
-
-    # Find user by email
-    user = db.query(User).filter(User.email == request.email).first()
+    # Find user by email, off the event loop
+    user = await run_in_threadpool(get_user_by_email, db, request.email)
     if not user:
         logger.warning(f"Password reset failed: User not found - {request.email}")
         raise HTTPException(
@@ -209,39 +311,29 @@ async def forgot_password(request: ForgotPasswordRequest, db: Session = Depends(
     # Generate reset token (JWT with 30 min expiration)
     reset_token_data = {
         "sub": user.email,
-        "exp": datetime.utcnow() + timedelta(minutes=30),
+        "exp": datetime.utcnow() + RESET_TOKEN_TTL,
         "type": "password_reset"
     }
-    JWT_SECRET = os.getenv("JWT_SECRET_KEY")
-    reset_token = jwt.encode(reset_token_data, JWT_SECRET, algorithm="HS256")
+    reset_token = jwt.encode(reset_token_data, JWT_SECRET, algorithm=RESET_TOKEN_ALGORITHM)
 
     # Build reset link
     base_url = os.getenv("URL_BASE_WEBSITE", "http://localhost:3000")
     reset_link = f"{base_url}/reset-password?token={reset_token}"
 
-    # Send email
-    try:
-        message = MessageSchema(
-            subject="Reset Your Password - PersonalWeb03",
-            recipients=[request.email],
-            template_body={"reset_link": reset_link},
-            subtype=MessageType.html
-        )
-
-        await fastmail.send_message(message, template_name="password_reset.html")
-
-        # Record this request
-        reset_email_requests[email_lower].append(now)
+    # Record this request before sending so the limit holds whatever the
+    # send outcome
+    counts = _reset_request_counts(email_lower, minute)
+    counts[-1] += 1
+    reset_email_requests[email_lower] = (minute, counts)
+    reset_email_requests.move_to_end(email_lower)
+    if len(reset_email_requests) > RESET_RATE_MAX_ENTRIES:
+        reset_email_requests.popitem(last=False)
 
-        logger.info(f"Password reset email sent to: {request.email}")
-        return {"message": "Password reset email sent successfully"}
+    # Queue email
+    background_tasks.add_task(_send_reset_email, request.email, reset_link)
 
-    except Exception as e:
-        logger.error(f"Failed to send password reset email to {request.email}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to send reset email. Please try again later."
-        )
+    logger.info(f"Password reset email queued for: {request.email}")
+    return {"message": "Password reset email sent successfully"}
 
 
 @router.post("/reset-password")
@@ -263,8 +355,7 @@ def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db))
 
     # Verify and decode token
     try:
-        JWT_SECRET = os.getenv("JWT_SECRET_KEY")
-        payload = jwt.decode(request.token, JWT_SECRET, algorithms=["HS256"])
+        payload = jwt.decode(request.token, JWT_SECRET, algorithms=[RESET_TOKEN_ALGORITHM])
 
         # Verify token type
         if payload.get("type") != "password_reset":
@@ -282,7 +373,7 @@ def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db))
                 detail="Invalid reset token"
             )
 
-    except JWTError as e:
+    except jwt.InvalidTokenError as e:
         logger.warning(f"JWT decode error: {e}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -290,7 +381,7 @@ def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db))
         )
 
     # Find user
-    user = db.query(User).filter(User.email == email).first()
+    user = get_user_by_email(db, email)
     if not user:
         logger.warning(f"Password reset failed: User not found - {email}")
         raise HTTPException(
@@ -302,6 +393,9 @@ def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db))
     new_password_hash = hash_password(request.new_password)
     user.password_hash = new_password_hash
     db.commit()
+    # The old password must stop working immediately; this also drops the
+    # cached password hash used by login
+    clear_login_cache()
 
     logger.info(f"Password reset successfully for: {email}")
     return {"message": "Password reset successfully"}
@@ -1,32 +1,166 @@
 """Blog router for managing blog posts."""
 
-import os
 import logging
 import zipfile
 import shutil
-from pathlib import Path
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status, UploadFile, File, Form
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from dotenv import load_dotenv
 
+from src.config import settings
 from src.database import get_db
 from src.models import BlogPost, User
 from src.schemas import BlogPostList, BlogPostDetail, BlogPostUpdate, BlogPostCreateLink
 from src.auth import get_current_user
-
-# Load environment variables
-load_dotenv()
+from src.static_files import evict_static_lookups
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Blog"])
 
-# Get blog path from environment
-PATH_BLOG = os.getenv("PATH_BLOG")
-if not PATH_BLOG:
-    raise ValueError("PATH_BLOG must be set in .env file")
+# Get blog path from configuration
+PATH_BLOG = settings().path_blog
+
+# Largest total uncompressed size accepted for a post ZIP
+MAX_ZIP_UNCOMPRESSED_SIZE = 200 * 1024 * 1024  # 200 MB
+
+# Post upload layout
+POST_MD_NAME = "post.md"
+MACOSX_PREFIX = "__MACOSX/"
+
+# Read size when writing extracted members
+EXTRACT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Number of post.md files kept in memory
+MARKDOWN_CACHE_SIZE = 512
+
+
+def _check_zip_members(zip_ref: zipfile.ZipFile) -> None:
+    """
+    Reject a ZIP whose members would escape the post directory or expand too far.
+
+    Args:
+        zip_ref: Open ZIP archive
+
+    Raises:
+        HTTPException: 400 for absolute or parent-relative member paths,
+            413 if the members exceed MAX_ZIP_UNCOMPRESSED_SIZE
+    """
+    total_size = 0
+    for info in zip_ref.infolist():
+        member_path = PurePosixPath(info.filename.replace("\\", "/"))
+        if member_path.is_absolute() or ".." in member_path.parts:
+            logger.warning(f"Unsafe ZIP member path: {info.filename}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="ZIP file contains an invalid path"
+            )
+
+        total_size += info.file_size
+        if total_size > MAX_ZIP_UNCOMPRESSED_SIZE:
+            logger.warning(f"ZIP contents exceed {MAX_ZIP_UNCOMPRESSED_SIZE} bytes")
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="ZIP file is too large"
+            )
+
+
+def _find_post_md_prefix(names: List[str]) -> Optional[str]:
+    """
+    Locate post.md among ZIP member names.
+
+    Args:
+        names: Member names from the archive
+
+    Returns:
+        Optional[str]: Folder prefix of the shallowest post.md ("" for the
+        archive root, "dir/" for a subdirectory), or None if there is none
+    """
+    prefixes = [
+        name[:-len(POST_MD_NAME)]
+        for name in names
+        if (name == POST_MD_NAME or name.endswith("/" + POST_MD_NAME))
+        and not name.startswith(MACOSX_PREFIX)
+    ]
+    if not prefixes:
+        return None
+    return min(prefixes, key=lambda prefix: prefix.count("/"))
+
+
+def _extract_post_files(zip_ref: zipfile.ZipFile, prefix: str, post_dir: Path) -> None:
+    """
+    Extract the members under a folder prefix into the post directory root.
+
+    macOS metadata entries are skipped.
+
+    Args:
+        zip_ref: Open ZIP archive whose member paths were already checked
+        prefix: Folder prefix to strip from member names
+        post_dir: Destination directory
+    """
+    for info in zip_ref.infolist():
+        name = info.filename
+        if not name.startswith(prefix) or name.startswith(MACOSX_PREFIX):
+            continue
+
+        relative_name = name[len(prefix):]
+        if not relative_name:
+            continue
+
+        dest = post_dir / relative_name
+        if info.is_dir():
+            dest.mkdir(parents=True, exist_ok=True)
+            continue
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with zip_ref.open(info) as src, open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+
+
+@lru_cache(maxsize=MARKDOWN_CACHE_SIZE)
+def _read_markdown(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a post.md file, cached per file version.
+
+    The modification time and size are part of the cache key, so an edited
+    file is read again on its next request.
+
+    Args:
+        path: Path to post.md
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        str: Markdown content
+    """
+    return Path(path).read_text(encoding='utf-8')
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header lists the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def _discard_post(db: Session, post: BlogPost, post_dir: Path) -> None:
+    """
+    Remove a post whose upload failed, along with its directory.
+
+    Args:
+        db: Database session
+        post: Blog post record to delete
+        post_dir: Directory created for the post
+    """
+    db.delete(post)
+    db.commit()
+    shutil.rmtree(post_dir, ignore_errors=True)
+    evict_static_lookups(str(post_dir))
 
 
 @router.post("/create-post", status_code=status.HTTP_201_CREATED)
@@ -64,11 +198,10 @@ def create_post(
     # Create new blog post record
     new_post = BlogPost(
         title=title,
-        directory_name=""  # Will be updated after getting ID
+        directory_name=None  # Will be updated after getting ID
     )
     db.add(new_post)
-    db.commit()
-    db.refresh(new_post)
+    db.flush()  # Assigns new_post.id without committing
 
     # Generate zero-padded directory name
     directory_name = f"{new_post.id:04d}"
@@ -87,65 +220,39 @@ def create_post(
 
     logger.info(f"Created directory: {post_dir}")
 
-    # Extract ZIP contents
+    # Check member paths and sizes, then extract the folder holding post.md
     try:
         with zipfile.ZipFile(zip_file.file, 'r') as zip_ref:
-            zip_ref.extractall(post_dir)
+            _check_zip_members(zip_ref)
+
+            # Find post.md (might be in a subdirectory)
+            post_md_prefix = _find_post_md_prefix(zip_ref.namelist())
+            if post_md_prefix is None:
+                logger.error(f"post.md not found in ZIP for post {new_post.id}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="ZIP file must contain post.md"
+                )
+            if post_md_prefix:
+                logger.info(f"Found post.md in subdirectory: {post_md_prefix}")
+
+            _extract_post_files(zip_ref, post_md_prefix, post_dir)
         logger.info(f"Extracted ZIP contents to {post_dir}")
+        # A reused post id must not serve lookups cached for the old files
+        evict_static_lookups(str(post_dir))
+    except HTTPException:
+        # Clean up: delete post record and directory
+        _discard_post(db, new_post, post_dir)
+        raise
     except zipfile.BadZipFile:
         logger.error(f"Invalid ZIP file uploaded for post {new_post.id}")
         # Clean up: delete post record and directory
-        db.delete(new_post)
-        db.commit()
+        _discard_post(db, new_post, post_dir)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid ZIP file"
         )
 
-    # Clean up macOS metadata folder if it exists
-    macosx_dir = post_dir / "__MACOSX"
-    if macosx_dir.exists():
-        shutil.rmtree(macosx_dir)
-        logger.info(f"Removed __MACOSX metadata folder")
-
-    # Find post.md (might be in a subdirectory)
-    post_md_path = post_dir / "post.md"
-    if not post_md_path.exists():
-        # Search for post.md in subdirectories
-        post_md_files = list(post_dir.rglob("post.md"))
-        if not post_md_files:
-            logger.error(f"post.md not found in ZIP for post {new_post.id}")
-            # Clean up: delete post record and directory
-            db.delete(new_post)
-            db.commit()
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="ZIP file must contain post.md"
-            )
-
-        # Found post.md in a subdirectory - move all contents to root
-        post_md_path = post_md_files[0]
-        source_dir = post_md_path.parent
-        logger.info(f"Found post.md in subdirectory: {source_dir}")
-
-        # Move all files from subdirectory to post_dir root
-        for item in source_dir.iterdir():
-            dest = post_dir / item.name
-            if dest.exists():
-                # Skip if destination already exists (shouldn't happen normally)
-                logger.warning(f"Skipping {item.name}, already exists in destination")
-                continue
-            shutil.move(str(item), str(dest))
-            logger.debug(f"Moved {item.name} to post directory root")
-
-        # Remove the now-empty subdirectory
-        if source_dir.exists() and source_dir != post_dir:
-            shutil.rmtree(source_dir)
-            logger.info(f"Removed empty subdirectory: {source_dir.name}")
-
-        # Update post_md_path to the new location
-        post_md_path = post_dir / "post.md"
-
     logger.info(f"Blog post created successfully: {new_post.id}")
     return {
         "id": new_post.id,
@@ -237,23 +344,23 @@ def update_post(
     # Update fields if provided
     if update_data.title is not None:
         post.title = update_data.title
-        logger.debug(f"Updated title for post {post_id}")
+        logger.debug("Updated title for post %s", post_id)
 
     if update_data.description is not None:
         post.description = update_data.description
-        logger.debug(f"Updated description for post {post_id}")
+        logger.debug("Updated description for post %s", post_id)
 
     if update_data.post_item_image is not None:
         post.post_item_image = update_data.post_item_image
-        logger.debug(f"Updated post_item_image for post {post_id}")
+        logger.debug("Updated post_item_image for post %s", post_id)
 
     if update_data.date_shown_on_blog is not None:
         post.date_shown_on_blog = update_data.date_shown_on_blog
-        logger.debug(f"Updated date_shown_on_blog for post {post_id}")
+        logger.debug("Updated date_shown_on_blog for post %s", post_id)
 
     if update_data.link_to_external_post is not None:
         post.link_to_external_post = update_data.link_to_external_post
-        logger.debug(f"Updated link_to_external_post for post {post_id}")
+        logger.debug("Updated link_to_external_post for post %s", post_id)
 
     db.commit()
     db.refresh(post)
@@ -269,20 +376,50 @@ def update_post(
 
 
 @router.get("/blog", response_model=List[BlogPostList])
-def list_posts(db: Session = Depends(get_db)):
+def list_posts(
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
     """
-    List all blog posts (id and title only).
+    List blog posts with the fields shown on the blog index.
+
+    Only the listed columns are selected, and rows are serialized straight
+    to JSON without building BlogPostList models; the response model is kept
+    for the API schema.
 
     Args:
+        limit: Maximum number of posts to return (all if omitted)
+        offset: Number of posts to skip
         db: Database session
 
     Returns:
-        List[BlogPostList]: List of blog posts with id and title
+        ORJSONResponse: List[BlogPostList] as JSON, ordered by id
     """
     logger.info("Fetching all blog posts")
-    posts = db.query(BlogPost).all()
+    query = db.query(
+        BlogPost.id,
+        BlogPost.title,
+        BlogPost.description,
+        BlogPost.post_item_image,
+        BlogPost.link_to_external_post,
+        BlogPost.date_shown_on_blog
+    ).order_by(BlogPost.id).offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    posts = [
+        {
+            "id": post_id,
+            "title": title,
+            "description": description,
+            "post_item_image": post_item_image,
+            "url": link_to_external_post,
+            "date": date_shown_on_blog
+        }
+        for post_id, title, description, post_item_image, link_to_external_post, date_shown_on_blog in query
+    ]
     logger.info(f"Found {len(posts)} blog posts")
-    return posts
+    return ORJSONResponse(content=posts)
 
 
 @router.get("/blog/icons")
@@ -328,12 +465,17 @@ def list_icons(current_user: User = Depends(get_current_user)):
 
 # GET /blog/{post_id}
 @router.get("/blog/{post_id}", response_model=BlogPostDetail)
-def get_post(post_id: int, db: Session = Depends(get_db)):
+def get_post(post_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Get detailed blog post information including markdown content.
 
+    The response carries an ETag built from the post's updated_at and the
+    post.md modification time; a matching If-None-Match gets a 304.
+
     Args:
         post_id: Blog post ID
+        request: Incoming request, for If-None-Match
+        response: Outgoing response, for the ETag header
         db: Database session
 
     Returns:
@@ -355,19 +497,30 @@ def get_post(post_id: int, db: Session = Depends(get_db)):
 
     # Read markdown content (only if directory_name exists)
     markdown_content = None
+    post_md_stat = None
     if post.directory_name:
         posts_dir = Path(PATH_BLOG) / "posts"
         post_md_path = posts_dir / post.directory_name / "post.md"
 
-        if not post_md_path.exists():
+        try:
+            post_md_stat = post_md_path.stat()
+        except FileNotFoundError:
             logger.error(f"post.md not found for post {post_id} at {post_md_path}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Post markdown file not found"
             )
 
+    mtime_ns = post_md_stat.st_mtime_ns if post_md_stat else 0
+    etag = f'W/"{post.id}-{post.updated_at.timestamp():.6f}-{mtime_ns}"'
+    if _etag_matches(request, etag):
+        logger.info(f"Blog post {post_id} not modified")
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    if post_md_stat:
         try:
-            markdown_content = post_md_path.read_text(encoding='utf-8')
+            markdown_content = _read_markdown(str(post_md_path), post_md_stat.st_mtime_ns, post_md_stat.st_size)
             logger.info(f"Read markdown content for post {post_id}")
         except Exception as e:
             logger.error(f"Error reading markdown file for post {post_id}: {e}")
@@ -442,6 +595,7 @@ def delete_post(
             # Continue anyway - we'll still delete the database record
     else:
         logger.warning(f"Directory not found, skipping filesystem deletion: {post_dir}")
+    evict_static_lookups(str(post_dir))
 
     # Delete database record
     db.delete(post)
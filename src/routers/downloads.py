@@ -3,26 +3,55 @@
 import os
 import logging
 from pathlib import Path
+from urllib.parse import quote
 from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import FileResponse
-from dotenv import load_dotenv
+from fastapi.responses import FileResponse, Response
 
-# Load environment variables
-load_dotenv()
+from src.config import settings
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/downloads", tags=["Downloads"])
 
-# Get project resources path from environment
-PATH_PROJECT_RESOURCES = os.getenv("PATH_PROJECT_RESOURCES")
-if not PATH_PROJECT_RESOURCES:
-    raise ValueError("PATH_PROJECT_RESOURCES must be set in .env file")
+# Get project resources path from configuration
+PATH_PROJECT_RESOURCES = settings().path_project_resources
 
 # Path to downloadable files directory
 DOWNLOADABLE_PATH = Path(PATH_PROJECT_RESOURCES) / "downloadable"
 
+# Resolved once; the directory may not exist yet when this module loads
+DOWNLOADABLE_BASE = str(DOWNLOADABLE_PATH.resolve())
+
+# nginx internal location for the downloadable directory; when set, nginx
+# sends the file body instead of this process
+ACCEL_REDIRECT_PREFIX = settings().downloads_accel_redirect
+
+
+def _accel_redirect_response(filename: str) -> Response:
+    """
+    Hand a download off to nginx with an X-Accel-Redirect header.
+
+    Args:
+        filename: Name of the validated file to send
+
+    Returns:
+        Response: Empty response carrying the redirect and download headers
+    """
+    quoted_filename = quote(filename)
+    if quoted_filename != filename:
+        content_disposition = f"attachment; filename*=utf-8''{quoted_filename}"
+    else:
+        content_disposition = f'attachment; filename="{filename}"'
+
+    return Response(
+        media_type="application/octet-stream",
+        headers={
+            "X-Accel-Redirect": f"{ACCEL_REDIRECT_PREFIX}{quoted_filename}",
+            "Content-Disposition": content_disposition
+        }
+    )
+
 
 @router.get("/{filename}")
 def download_file(filename: str):
@@ -33,7 +62,8 @@ def download_file(filename: str):
         filename: Name of the file to download
 
     Returns:
-        FileResponse: The requested file
+        FileResponse: The requested file, or an X-Accel-Redirect response
+        when DOWNLOADS_ACCEL_REDIRECT is configured
 
     Raises:
         HTTPException: If file not found or path traversal attempted
@@ -52,7 +82,7 @@ def download_file(filename: str):
     file_path = DOWNLOADABLE_PATH / filename
 
     # Check if file exists and is actually a file (not a directory)
-    if not file_path.exists() or not file_path.is_file():
+    if not file_path.is_file():
         logger.warning(f"File not found: {filename}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -60,9 +90,7 @@ def download_file(filename: str):
         )
 
     # Ensure the resolved path is within the downloadable directory
-    try:
-        file_path.resolve().relative_to(DOWNLOADABLE_PATH.resolve())
-    except ValueError:
+    if os.path.commonpath([str(file_path.resolve()), DOWNLOADABLE_BASE]) != DOWNLOADABLE_BASE:
         logger.warning(f"Path traversal attempt detected: {filename}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -70,6 +98,9 @@ def download_file(filename: str):
         )
 
     logger.info(f"Serving file: {filename}")
+    if ACCEL_REDIRECT_PREFIX:
+        return _accel_redirect_response(filename)
+
     return FileResponse(
         path=str(file_path),
         filename=filename,
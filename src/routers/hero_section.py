@@ -1,33 +1,66 @@
 """Hero section router for providing homepage data."""
 
-import os
 import csv
+import sys
+import asyncio
 import logging
+import threading
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
-from fastapi import APIRouter, HTTPException, status
-from dotenv import load_dotenv
-
+from datetime import date
+from typing import Dict, Optional, Tuple
+import orjson
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+
+from src.config import settings
 from src.schemas import HeroSectionData, UpToLately, TogglTableItem
 
-# Load environment variables
-load_dotenv()
-
 # Configure logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/hero-section", tags=["Hero Section"])
 
-# Get project resources path from environment
-PATH_PROJECT_RESOURCES = os.getenv("PATH_PROJECT_RESOURCES")
-if not PATH_PROJECT_RESOURCES:
-    raise ValueError("PATH_PROJECT_RESOURCES must be set in .env file")
+# Get project resources path from configuration
+PATH_PROJECT_RESOURCES = settings().path_project_resources
 
-# GET /hero-section/data
-@router.get("/data", response_model=HeroSectionData)
-def get_hero_section_data():
+# Hero section source files
+HERO_SECTION_PATH = Path(PATH_PROJECT_RESOURCES) / "hero-section"
+HERO_MD_PATH = HERO_SECTION_PATH / "last-7-days-activities-summary.md"
+HERO_CSV_PATH = HERO_SECTION_PATH / "project_time_entries.csv"
+
+# Serialized hero data for the current file versions, keyed by (markdown
+# mtime_ns, CSV mtime_ns); holds at most one entry
+_hero_cache: Dict[Tuple[int, int], bytes] = {}
+_hero_cache_lock = threading.Lock()
+
+# Seconds between background checks for changed hero section files
+HERO_POLL_INTERVAL_SECONDS = 30
+
+# Background task that keeps the cache warm
+_hero_watch_task: Optional[asyncio.Task] = None
+
+
+def _hero_file_versions() -> Optional[Tuple[int, int]]:
     """
-    Get hero section data including up_to_lately text and toggl table.
+    Stat the hero section source files.
+
+    Returns:
+        Optional[Tuple[int, int]]: Modification times in nanoseconds of the
+        markdown and CSV files, or None if either is missing
+    """
+    try:
+        md_mtime_ns = HERO_MD_PATH.stat().st_mtime_ns
+        csv_mtime_ns = HERO_CSV_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return md_mtime_ns, csv_mtime_ns
+
+
+def _build_hero_section_data() -> HeroSectionData:
+    """
+    Read the hero section files and build the response data.
 
     Returns:
         HeroSectionData: Hero section data with text and project hours
@@ -35,79 +68,170 @@ def get_hero_section_data():
     Raises:
         HTTPException: If files are not found or cannot be read
     """
-    logger.info("Fetching hero section data")
-
-    hero_section_dir = Path(PATH_PROJECT_RESOURCES) / "hero-section"
-
     # Read up_to_lately text from markdown file
-    md_file_path = hero_section_dir / "last-7-days-activities-summary.md"
-    if not md_file_path.exists():
-        logger.error(f"Markdown file not found: {md_file_path}")
+    md_file_path = HERO_MD_PATH
+    try:
+        up_to_lately_text = md_file_path.read_bytes().decode('utf-8').strip()
+        logger.debug("Read %d characters from markdown file", len(up_to_lately_text))
+    except FileNotFoundError:
+        logger.error("Markdown file not found: %s", md_file_path)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Activities summary file not found"
         )
-
-    try:
-        up_to_lately_text = md_file_path.read_text(encoding='utf-8').strip()
-        logger.debug(f"Read {len(up_to_lately_text)} characters from markdown file")
     except Exception as e:
-        logger.error(f"Error reading markdown file: {e}")
+        logger.error("Error reading markdown file: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error reading activities summary"
         )
 
     # Read and parse CSV file for toggl table
-    csv_file_path = hero_section_dir / "project_time_entries.csv"
-    if not csv_file_path.exists():
-        logger.error(f"CSV file not found: {csv_file_path}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project time entries file not found"
-        )
-
+    csv_file_path = HERO_CSV_PATH
     try:
         toggl_items = []
         collection_date = None
 
         with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                # Parse project data
-                toggl_items.append(TogglTableItem(
-                    project_name=row['project_name'],
-                    total_hours=float(row['total_hours'])
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            rows = [row for row in reader if row] if header else []
+
+        if rows:
+            # Resolve column positions once from the header
+            name_i = header.index('project_name')
+            hours_i = header.index('total_hours')
+
+            # Extract date from first row (all rows have same datetime_collected)
+            if 'datetime_collected' in header:
+                # Keep just the date portion of "YYYY-MM-DD HH:MM:SS"
+                datetime_str = rows[0][header.index('datetime_collected')]
+                collection_date = date.fromisoformat(datetime_str[:10]).isoformat()
+
+            # Sort projects alphabetically by name, lowering each name once
+            sorted_rows = sorted(((row[name_i].lower(), row) for row in rows), key=itemgetter(0))
+
+            for _, row in sorted_rows:
+                # Parse project data; values are already typed, so skip validation
+                toggl_items.append(TogglTableItem.model_construct(
+                    # Project names repeat across rebuilds; share one string each
+                    project_name=sys.intern(row[name_i]),
+                    total_hours=float(row[hours_i])
                 ))
 
-                # Extract date from first row (all rows have same datetime_collected)
-                if collection_date is None and 'datetime_collected' in row:
-                    # Parse datetime and extract just the date portion
-                    datetime_str = row['datetime_collected']
-                    dt = datetime.strptime(datetime_str, '%Y-%m-%d %H:%M:%S')
-                    collection_date = dt.strftime('%Y-%m-%d')
-
-        logger.info(f"Parsed {len(toggl_items)} projects from CSV")
+        logger.info("Parsed %d projects from CSV", len(toggl_items))
 
+    except FileNotFoundError:
+        logger.error("CSV file not found: %s", csv_file_path)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project time entries file not found"
+        )
     except Exception as e:
-        logger.error(f"Error reading CSV file: {e}")
+        logger.error("Error reading CSV file: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error reading project time entries"
         )
 
-    # Sort projects alphabetically by name
-    toggl_items.sort(key=lambda x: x.project_name.lower())
-    logger.debug("Sorted projects alphabetically")
-
-    # Build response
-    response = HeroSectionData(
-        up_to_lately=UpToLately(
+    # Build response from already-typed values without revalidating
+    response = HeroSectionData.model_construct(
+        up_to_lately=UpToLately.model_construct(
             text=up_to_lately_text,
             date=collection_date or ""
         ),
         toggl_table=toggl_items
     )
 
-    logger.info("Hero section data retrieved successfully")
     return response
+
+
+async def _rebuild_hero_cache(versions: Optional[Tuple[int, int]]) -> bytes:
+    """
+    Build and serialize hero section data, caching it for the file versions.
+
+    Args:
+        versions: File modification times from _hero_file_versions(), or
+            None if a file is missing (nothing is cached then)
+
+    Returns:
+        bytes: HeroSectionData as JSON
+
+    Raises:
+        HTTPException: If files are not found or cannot be read
+    """
+    data = await run_in_threadpool(_build_hero_section_data)
+    payload = orjson.dumps(data.model_dump())
+
+    if versions is not None:
+        with _hero_cache_lock:
+            _hero_cache.clear()
+            _hero_cache[versions] = payload
+
+    return payload
+
+
+async def _watch_hero_files() -> None:
+    """
+    Rebuild the hero section cache whenever the source files change.
+
+    Polls the file modification times so the first request after a daily
+    update does not pay for parsing.
+    """
+    while True:
+        versions = _hero_file_versions()
+        if versions is not None and versions not in _hero_cache:
+            try:
+                await _rebuild_hero_cache(versions)
+                logger.info("Hero section cache refreshed")
+            except Exception as e:
+                logger.warning("Could not refresh hero section cache: %s", e)
+        await asyncio.sleep(HERO_POLL_INTERVAL_SECONDS)
+
+
+@router.on_event("startup")
+async def start_hero_watcher():
+    """Start warming the hero section cache in the background."""
+    global _hero_watch_task
+    _hero_watch_task = asyncio.create_task(_watch_hero_files())
+
+
+@router.on_event("shutdown")
+async def stop_hero_watcher():
+    """Stop the hero section cache watcher."""
+    if _hero_watch_task is not None:
+        _hero_watch_task.cancel()
+
+
+# GET /hero-section/data
+# The body is orjson-encoded here, so HeroSectionData is only declared
+# for the API schema
+@router.get("/data", response_class=ORJSONResponse, responses={200: {"model": HeroSectionData}})
+async def get_hero_section_data():
+    """
+    Get hero section data including up_to_lately text and toggl table.
+
+    The serialized JSON is cached until either source file's modification
+    time changes. Cache hits are served on the event loop; only a rebuild
+    reads the files on a worker thread.
+
+    Returns:
+        Response: HeroSectionData as JSON
+
+    Raises:
+        HTTPException: If files are not found or cannot be read
+    """
+    logger.info("Fetching hero section data")
+
+    versions = _hero_file_versions()
+    if versions is not None:
+        with _hero_cache_lock:
+            cached = _hero_cache.get(versions)
+        if cached is not None:
+            logger.debug("Hero section data served from cache")
+            return Response(content=cached, media_type="application/json")
+
+    payload = await _rebuild_hero_cache(versions)
+
+    logger.info("Hero section data retrieved successfully")
+    return Response(content=payload, media_type="application/json")
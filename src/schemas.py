@@ -1,55 +1,36 @@
 """Pydantic schemas for request and response validation."""
 
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, field_validator, Field
+from typing import Annotated, Optional
+from pydantic import AfterValidator, BaseModel, EmailStr, Field
+
+
+def _not_empty(label: str) -> AfterValidator:
+    """Build a validator that rejects empty or whitespace-only strings."""
+    def check(v: str) -> str:
+        if not v or not v.strip():
+            raise ValueError(f'{label} cannot be empty')
+        return v
+    return AfterValidator(check)
+
+
+NonEmptyEmail = Annotated[str, _not_empty('Email')]
+NonEmptyPassword = Annotated[str, _not_empty('Password')]
 
 
 # Auth Schemas
 class UserRegister(BaseModel):
     """Schema for user registration request."""
 
-    email: str
-    password: str
-
-    @field_validator('email')
-    @classmethod
-    def email_not_empty(cls, v: str) -> str:
-        """Validate that email is not empty."""
-        if not v or not v.strip():
-            raise ValueError('Email cannot be empty')
-        return v
-
-    @field_validator('password')
-    @classmethod
-    def password_not_empty(cls, v: str) -> str:
-        """Validate that password is not empty."""
-        if not v or not v.strip():
-            raise ValueError('Password cannot be empty')
-        return v
+    email: NonEmptyEmail
+    password: NonEmptyPassword
 
 
 class UserLogin(BaseModel):
     """Schema for user login request."""
 
-    email: str
-    password: str
-
-    @field_validator('email')
-    @classmethod
-    def email_not_empty(cls, v: str) -> str:
-        """Validate that email is not empty."""
-        if not v or not v.strip():
-            raise ValueError('Email cannot be empty')
-        return v
-
-    @field_validator('password')
-    @classmethod
-    def password_not_empty(cls, v: str) -> str:
-        """Validate that password is not empty."""
-        if not v or not v.strip():
-            raise ValueError('Password cannot be empty')
-        return v
+    email: NonEmptyEmail
+    password: NonEmptyPassword
 
 
 class Token(BaseModel):
@@ -59,6 +40,19 @@ class Token(BaseModel):
     token_type: str
 
 
+class ForgotPasswordRequest(BaseModel):
+    """Schema for forgot password request."""
+
+    email: EmailStr
+
+
+class ResetPasswordRequest(BaseModel):
+    """Schema for reset password request."""
+
+    token: str
+    new_password: str
+
+
 # Blog Post Schemas
 class BlogPostCreate(BaseModel):
     """Schema for blog post creation request."""
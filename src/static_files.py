@@ -0,0 +1,82 @@
+"""Static file serving with a short-lived lookup cache."""
+
+import os
+import stat
+import threading
+import weakref
+import anyio.to_thread
+from typing import Optional, Tuple
+from cachetools import TTLCache
+from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
+from starlette.types import Scope
+
+# Every CachedStaticFiles instance, so routers can evict paths they change
+_instances: "weakref.WeakSet[CachedStaticFiles]" = weakref.WeakSet()
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that remembers file lookups for a few seconds.
+
+    A cache hit skips the path resolution that StaticFiles makes on every
+    request. The file is still stat'ed on each hit, in the threadpool so
+    the event loop never blocks on disk, and a changed or missing file
+    falls back to a normal lookup, so the response never describes an old
+    version of the file.
+    ETag/Last-Modified headers and 304 responses are unchanged.
+    """
+
+    def __init__(self, *args, lookup_cache_ttl: float = 5.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lookup_cache = TTLCache(maxsize=1024, ttl=lookup_cache_ttl)
+        self._lookup_lock = threading.Lock()
+        _instances.add(self)
+
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        """Resolve a path and cache it if it is a regular file."""
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+            with self._lookup_lock:
+                self._lookup_cache[path] = (full_path, stat_result)
+        return full_path, stat_result
+
+    def evict(self, directory: str) -> None:
+        """Drop cached lookups for files under a directory."""
+        prefix = os.path.join(os.path.realpath(directory), "")
+        with self._lookup_lock:
+            stale = [path for path, (full_path, _) in self._lookup_cache.items() if full_path.startswith(prefix)]
+            for path in stale:
+                del self._lookup_cache[path]
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve unchanged cached lookups directly, otherwise defer to StaticFiles."""
+        if scope["method"] in ("GET", "HEAD"):
+            with self._lookup_lock:
+                cached = self._lookup_cache.get(path)
+            if cached is not None:
+                full_path, cached_stat = cached
+                try:
+                    stat_result = await anyio.to_thread.run_sync(os.stat, full_path)
+                except OSError:
+                    stat_result = None
+                if (
+                    stat_result is not None
+                    and stat_result.st_mtime_ns == cached_stat.st_mtime_ns
+                    and stat_result.st_size == cached_stat.st_size
+                ):
+                    return self.file_response(full_path, stat_result, scope)
+                with self._lookup_lock:
+                    self._lookup_cache.pop(path, None)
+        return await super().get_response(path, scope)
+
+
+def evict_static_lookups(directory: str) -> None:
+    """
+    Drop cached static file lookups for files under a directory.
+
+    Args:
+        directory: Directory whose files were changed or removed
+    """
+    for static_files in list(_instances):
+        static_files.evict(directory)